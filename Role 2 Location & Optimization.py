@@ -65,9 +65,8 @@ class Shelf(StorageLocation):
 
     def is_suitable(self, product):
         """Checks if product is Durable and fits weight limits."""
-        # Role 1 compatibility check
-        from project import DurableProduct
-        if not isinstance(product, DurableProduct):
+        # Role 1 compatibility check (duck-typed, no per-call import of Role 1)
+        if product.product_type != "Durable":
             return False
         
         # Note: Added 'height' attribute check if exists, else defaults to True
@@ -88,8 +87,7 @@ class RefrigeratedUnit(StorageLocation):
 
     def is_suitable(self, product):
         """Checks if Perishable product falls within temp range."""
-        from project import PerishableProduct
-        if not isinstance(product, PerishableProduct):
+        if product.product_type != "Perishable":
             return False
         
         # Maps to PerishableProduct._req_temperature_c from Role 1
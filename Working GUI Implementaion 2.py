@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 # ==============================================================================
 # 🔗 BACKEND INTEGRATION (The Bridge)
@@ -18,6 +20,9 @@ except ImportError:
     print("CRITICAL ERROR: Could not import 'backend.py'. Make sure your logic file is named 'backend.py'")
     exit()
 
+# Sequential order IDs: unique by construction, no RNG or collision risk
+_order_seq = itertools.count(1)
+
 # ==============================================================================
 # 🎮 MAIN CONTROLLER (Role 4 Responsibility)
 # ==============================================================================
@@ -45,6 +50,10 @@ class SCWOS_GUI(tk.Tk):
         # Injecting dependencies into the optimizer
         self.optimizer = OptimizationEngine(self.inventory_mgr, self.warehouse)
         self.active_orders = [] # Local state list to track order objects
+        self.active_orders_by_id = {} # Same orders keyed by ID for O(1) lookup
+
+        # Worker threads for slow read-only jobs (log export), so the Tk loop never blocks
+        self._executor = ThreadPoolExecutor(max_workers=2)
         
         # --- PRE-LOAD DATA ---
         # We load dummy data so the professor sees a populated system immediately.
@@ -111,10 +120,14 @@ class SCWOS_GUI(tk.Tk):
             ("📜 System Logs", "LogsFrame")
         ]
         
+        # One shared set of options for all nav buttons. These stay tk.Buttons:
+        # the native ttk themes (vista, aqua) ignore a ttk.Button's background.
+        nav_style = dict(font=("Segoe UI", 12), fg="white", bg="#34495e", bd=0, pady=12,
+                         anchor="w", padx=20, activebackground="#1abc9c")
+
         # Loop to create buttons dynamically
         for text, frame_name in buttons:
-            btn = tk.Button(sidebar, text=text, font=("Segoe UI", 12), fg="white", bg="#34495e",
-                            bd=0, pady=12, anchor="w", padx=20, activebackground="#1abc9c",
+            btn = tk.Button(sidebar, text=text, **nav_style,
                             # Lambda function to pass specific frame name on click
                             command=lambda f=frame_name: self.show_frame(f))
             btn.pack(fill="x", pady=2)
@@ -145,10 +158,13 @@ class DashboardFrame(tk.Frame):
         self.stats_frame = tk.Frame(self, bg="white")
         self.stats_frame.pack(fill="x", padx=20)
         
-        # Reusable UI component creation
-        self.card_inv = self.create_card(self.stats_frame, "Total Products", "0", "#3498db")
-        self.card_val = self.create_card(self.stats_frame, "Inventory Value", "$0", "#2ecc71")
-        self.card_ord = self.create_card(self.stats_frame, "Active Orders", "0", "#e67e22")
+        # Reusable UI component creation (each card returns the StringVar it displays)
+        self.var_inv = self.create_card(self.stats_frame, "Total Products", "0", "#3498db")
+        self.var_val = self.create_card(self.stats_frame, "Inventory Value", "$0", "#2ecc71")
+        self.var_ord = self.create_card(self.stats_frame, "Active Orders", "0", "#e67e22")
+
+        # Last values shown, so unchanged cards are not touched on refresh
+        self._last_items = self._last_val = self._last_ords = None
 
     def create_card(self, parent, title, value, color):
         """Helper to create colored KPI cards."""
@@ -157,21 +173,27 @@ class DashboardFrame(tk.Frame):
         card.pack_propagate(False)
         
         tk.Label(card, text=title, font=("Arial", 10), fg="white", bg=color).pack(pady=(20,5))
-        lbl_value = tk.Label(card, text=value, font=("Arial", 20, "bold"), fg="white", bg=color)
-        lbl_value.pack()
-        return lbl_value
+        var_value = tk.StringVar(value=value)
+        tk.Label(card, textvariable=var_value, font=("Arial", 20, "bold"), fg="white", bg=color).pack()
+        return var_value
 
     def on_show(self):
         """Called every time this tab is opened to refresh numbers."""
         # INTEGRATION: Pulling data from Role 1 (Inventory) & Role 3 (Orders)
-        # Using direct access `_inventory` to ensure compatibility if getter is missing.
-        total_items = len(self.controller.inventory_mgr._inventory) 
-        total_val = self.controller.inventory_mgr.get_total_inventory_value()
+        inventory_mgr = self.controller.inventory_mgr
+        total_items = len(inventory_mgr.iter_products())
+        total_val = inventory_mgr.get_total_inventory_value()
         active_ords = len(self.controller.active_orders)
         
-        self.card_inv.config(text=str(total_items))
-        self.card_val.config(text=f"${total_val}")
-        self.card_ord.config(text=str(active_ords))
+        if total_items != self._last_items:
+            self.var_inv.set(str(total_items))
+            self._last_items = total_items
+        if total_val != self._last_val:
+            self.var_val.set(f"${total_val}")
+            self._last_val = total_val
+        if active_ords != self._last_ords:
+            self.var_ord.set(str(active_ords))
+            self._last_ords = active_ords
 
 # ==============================================================================
 # 📦 FRAME 2: INVENTORY (Demonstrating Role 1)
@@ -197,14 +219,18 @@ class InventoryFrame(tk.Frame):
         self.tree.column("Status/Details", width=250)
         self.tree.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
+        # Last values shown per product ID (rows use the ID as their iid)
+        self._rendered = {}
+
     def on_show(self):
         """Refreshes the table data from the Backend Dictionary."""
-        # Clear existing rows
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
+        # Only rows that changed are touched, instead of rebuilding the whole table
+        rendered = self._rendered
+        seen = set()
+
         # Loop through backend products
-        for p in self.controller.inventory_mgr._inventory.values():
+        products = self.controller.inventory_mgr.iter_products()
+        for p in products:
             detail = ""
             # OOP Principle: POLYMORPHISM 
             # We treat Perishable and Durable differently based on their type.
@@ -213,10 +239,23 @@ class InventoryFrame(tk.Frame):
             else:
                 detail = f"Material: {p._material_type}"
                 
-            self.tree.insert("", "end", values=(
+            values = (
                 p.product_id, p.name, p.product_type, 
                 f"${p.base_price}", f"{p.weight_kg}kg", f"{p.volume_m3}m3", detail
-            ))
+            )
+            pid = p.product_id
+            seen.add(pid)
+            old = rendered.get(pid)
+            if old is None:
+                self.tree.insert("", "end", iid=pid, values=values)
+            elif old != values:
+                self.tree.item(pid, values=values)
+            rendered[pid] = values
+
+        # Drop rows of products removed since the last refresh
+        for pid in rendered.keys() - seen:
+            self.tree.delete(pid)
+            del rendered[pid]
 
     def open_add_window(self):
         """Opens a pop-up window to add new products."""
@@ -327,36 +366,52 @@ class WarehouseFrame(tk.Frame):
         self.viz_container = tk.Frame(self, bg="white")
         self.viz_container.pack(fill="both", expand=True, padx=20, pady=20)
 
+        # Persistent widgets per location object (IDs need not be unique): (LabelFrame, Progressbar, Label)
+        self._loc_widgets = {}
+
     def on_show(self):
         """Populate dropdown and draw current warehouse state."""
-        prods = [p.name for p in self.controller.inventory_mgr._inventory.values()]
+        prods = [p.name for p in self.controller.inventory_mgr.iter_products()]
         self.prod_combo['values'] = prods
         if prods: self.prod_combo.current(0)
         self.draw_warehouse()
 
     def draw_warehouse(self):
         """Visualizes Storage Locations using Progress Bars."""
-        for w in self.viz_container.winfo_children(): w.destroy()
-        
+        # Widgets are created once per location and only updated afterwards
+        widgets = self._loc_widgets
+        seen = set()
+
         # Loop through Role 2 Storage Locations
         for loc in self.controller.warehouse.locations:
-            frame = tk.LabelFrame(self.viz_container, text=f"{loc.location_id} (Cap: {loc.capacity}kg)", 
-                                  font=("Arial", 12, "bold"), bg="white", fg="#2c3e50")
-            frame.pack(fill="x", pady=5)
+            seen.add(loc)
+            title = f"{loc.location_id} (Cap: {loc.capacity}kg)"
+            if loc not in widgets:
+                frame = tk.LabelFrame(self.viz_container, text=title, 
+                                      font=("Arial", 12, "bold"), bg="white", fg="#2c3e50")
+                frame.pack(fill="x", pady=5)
+                pb = ttk.Progressbar(frame, orient="horizontal", length=100, mode="determinate")
+                pb.pack(fill="x", padx=10, pady=5)
+                lbl = tk.Label(frame, bg="white")
+                lbl.pack(anchor="w", padx=10)
+                widgets[loc] = (frame, pb, lbl)
+            frame, pb, lbl = widgets[loc]
             
             # Calculate utilization %
             percent = (loc.current_load / loc.capacity) * 100
-            pb = ttk.Progressbar(frame, orient="horizontal", length=100, mode="determinate")
+            frame.config(text=title)
             pb['value'] = percent
-            pb.pack(fill="x", padx=10, pady=5)
-            
-            tk.Label(frame, text=f"Current Load: {loc.current_load}kg | Utilization: {percent:.1f}%", bg="white").pack(anchor="w", padx=10)
+            lbl.config(text=f"Current Load: {loc.current_load}kg | Utilization: {percent:.1f}%")
+
+        # Remove widgets of locations that no longer exist
+        for loc in widgets.keys() - seen:
+            widgets.pop(loc)[0].destroy()
 
     def run_optimizer(self):
         """Triggers Role 2 Algorithm."""
         p_name = self.prod_combo.get()
         # Find product object by name
-        product = next((p for p in self.controller.inventory_mgr._inventory.values() if p.name == p_name), None)
+        product = self.controller.inventory_mgr.get_by_name(p_name)
         
         if not product:
             return
@@ -402,12 +457,31 @@ class OrderFrame(tk.Frame):
         # Section: Manage Orders
         tk.Label(self, text="Active Orders", font=("Arial", 12, "bold"), bg="white").pack(anchor="w", padx=20, pady=(20,5))
         
-        self.order_tree = ttk.Treeview(self, columns=("ID", "Customer", "Status", "Items"), show="headings", height=8)
+        # Virtualized table: only the visible slice of orders exists as Treeview rows,
+        # and the scrollbar/mouse wheel move that slice over the full order list
+        table = tk.Frame(self, bg="white")
+        table.pack(fill="x", padx=20)
+        self.order_tree = ttk.Treeview(table, columns=("ID", "Customer", "Status", "Items"), show="headings",
+                                       height=self.VISIBLE_ROWS)
         self.order_tree.heading("ID", text="Order ID")
         self.order_tree.heading("Customer", text="Customer")
         self.order_tree.heading("Status", text="Status")
         self.order_tree.heading("Items", text="Items Count")
-        self.order_tree.pack(fill="x", padx=20)
+        self.order_scroll = ttk.Scrollbar(table, orient="vertical", command=self._on_scroll)
+        self.order_scroll.pack(side="right", fill="y")
+        self.order_tree.pack(side="left", fill="x", expand=True)
+        self.order_tree.bind("<MouseWheel>", lambda e: self._on_wheel(-1 if e.delta > 0 else 1))
+        self.order_tree.bind("<Button-4>", lambda e: self._on_wheel(-1)) # X11 wheel up
+        self.order_tree.bind("<Button-5>", lambda e: self._on_wheel(1)) # X11 wheel down
+        self._offset = 0 # Index in active_orders of the first visible row
+
+        # Products listed in the listbox (same positions) and the inventory version they reflect
+        self._listbox_products = []
+        self._listbox_version = None
+
+        # Row iid and last shown values per order object (order IDs may repeat)
+        self._row_iids = {}
+        self._row_values = {}
         
         # Workflow Action Buttons
         btn_frame = tk.Frame(self, bg="white")
@@ -417,19 +491,65 @@ class OrderFrame(tk.Frame):
         tk.Button(btn_frame, text="🚚 Ship Order", command=self.ship_order).pack(side="left", padx=5)
         tk.Button(btn_frame, text="📫 Deliver", command=self.deliver_order).pack(side="left", padx=5)
 
+    VISIBLE_ROWS = 8 # Treeview height; also the number of rows actually rendered
+
     def on_show(self):
         """Updates listbox with available inventory."""
-        self.item_list.delete(0, "end")
-        for p in self.controller.inventory_mgr._inventory.values():
-            self.item_list.insert("end", p.name)
+        inventory_mgr = self.controller.inventory_mgr
+        if inventory_mgr.version != self._listbox_version: # Rebuild only after a change
+            self._listbox_products = list(inventory_mgr.iter_products())
+            self._listbox_version = inventory_mgr.version
+            self.item_list.delete(0, "end")
+            for p in self._listbox_products:
+                self.item_list.insert("end", p.name)
         self.refresh_table()
 
     def refresh_table(self):
         """Updates the Order Table from local state."""
-        for item in self.order_tree.get_children():
-            self.order_tree.delete(item)
-        for o in self.controller.active_orders:
-            self.order_tree.insert("", "end", values=(o.order_id, o._customer_name, o.status, len(o.items)))
+        orders = self.controller.active_orders
+        self._offset = max(0, min(self._offset, len(orders) - self.VISIBLE_ROWS))
+        window = orders[self._offset:self._offset + self.VISIBLE_ROWS]
+        if orders:
+            self.order_scroll.set(self._offset / len(orders), (self._offset + len(window)) / len(orders))
+        else:
+            self.order_scroll.set(0, 1)
+
+        # Only changed, new and removed (or scrolled-out) orders touch the widget
+        row_iids = self._row_iids
+        row_values = self._row_values
+        if not row_iids: # Full build: prepending in reverse is cheaper than appending
+            for o in reversed(window):
+                values = (o.order_id, o._customer_name, o.status, len(o.items))
+                row_iids[o] = self.order_tree.insert("", 0, values=values)
+                row_values[o] = values
+            return
+
+        for o in row_iids.keys() - set(window):
+            self.order_tree.delete(row_iids.pop(o))
+            del row_values[o]
+
+        # Orders keep their relative order, so inserting at the window index keeps rows sorted
+        for index, o in enumerate(window):
+            values = (o.order_id, o._customer_name, o.status, len(o.items))
+            if o not in row_iids:
+                row_iids[o] = self.order_tree.insert("", index, values=values)
+            elif row_values[o] != values:
+                self.order_tree.item(row_iids[o], values=values)
+            row_values[o] = values
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Scrollbar callback: moves the visible window over the order list."""
+        if action == "moveto":
+            self._offset = int(float(amount) * len(self.controller.active_orders))
+        else: # "scroll" by units (rows) or pages
+            step = int(amount) * (self.VISIBLE_ROWS if unit == "pages" else 1)
+            self._offset += step
+        self.refresh_table()
+
+    def _on_wheel(self, rows):
+        """Mouse wheel scrolls the window instead of the (never overflowing) Treeview."""
+        self._on_scroll("scroll", rows, "units")
+        return "break"
 
     def create_order(self):
         """Instantiates Role 3 CustomerOrder."""
@@ -438,17 +558,14 @@ class OrderFrame(tk.Frame):
             messagebox.showwarning("Warning", "Select items first!")
             return
             
-        items_to_order = []
-        all_prods = list(self.controller.inventory_mgr._inventory.values())
-        for i in indices:
-            items_to_order.append(all_prods[i])
+        items_to_order = [self._listbox_products[i] for i in indices]
             
         # Role 3 Backend Usage
-        import random
-        oid = f"ORD-{random.randint(1000,9999)}"
+        oid = f"ORD-{next(_order_seq):04d}"
         new_order = CustomerOrder(oid, self.cust_entry.get(), items_to_order, self.controller.logger)
         
         self.controller.active_orders.append(new_order)
+        self.controller.active_orders_by_id.setdefault(oid, new_order) # First order with an ID wins, as before
         self.refresh_table()
         messagebox.showinfo("Success", f"Order {oid} Created!")
 
@@ -457,7 +574,7 @@ class OrderFrame(tk.Frame):
         sel = self.order_tree.selection()
         if not sel: return None
         oid = self.order_tree.item(sel[0])['values'][0]
-        return next((o for o in self.controller.active_orders if o.order_id == oid), None)
+        return self.controller.active_orders_by_id.get(oid)
 
     def pick_order(self):
         """Calls backend logic to transition state Pending -> Picked"""
@@ -502,14 +619,36 @@ class LogsFrame(tk.Frame):
         self.controller = controller
         tk.Label(self, text="System Logs", font=("Segoe UI", 18, "bold"), bg="white").pack(pady=20)
         
-        self.txt = tk.Text(self, font=("Consolas", 10))
+        # No undo history: the whole text is replaced on every show
+        self.txt = tk.Text(self, font=("Consolas", 10), undo=False, autoseparators=False)
         self.txt.pack(fill="both", expand=True, padx=20, pady=20)
+        self._pending = None # Latest export job
+
+    MAX_LINES = 10000 # Only the most recent records are displayed
         
+    POLL_MS = 50 # How often the Tk loop checks for the finished export
+
     def on_show(self):
+        # Role 3 Backend: Fetching logs from TransactionLogger on a worker thread.
+        # The records are copied here first, so new logs cannot change them mid-export
+        snapshot = self.controller.logger.snapshot(last=self.MAX_LINES)
+        self._pending = self.controller._executor.submit(snapshot.export_as_text)
+        self.after(self.POLL_MS, self._poll, self._pending)
+
+    def _poll(self, future):
+        """Inserts the exported logs once ready (runs on the Tk thread)."""
+        if future is not self._pending: # A newer refresh superseded this one
+            return
+        if not future.done():
+            self.after(self.POLL_MS, self._poll, future)
+            return
+        try:
+            logs = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export logs: {e}")
+            return
         self.txt.delete(1.0, "end")
-        # Role 3 Backend: Fetching logs from TransactionLogger
-        logs = self.controller.logger.export_as_text()
-        self.txt.insert("end", logs)
+        self.txt.insert("end", logs) # One insert for the whole text
 
 # ==============================================================================
 # 🏁 APP ENTRY POINT
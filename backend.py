@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, insort
 from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
 import random
 import string
+import sys
+import threading
+import time
+from queue import Empty, Queue
 
 # ==============================================================================
 #                                  SYSTEM OVERVIEW
@@ -23,6 +31,52 @@ import string
 # - Calculate financial values and storage costs
 # ==============================================================================
 
+# Interned category names: product_type is one of these exact objects (a class
+# constant), so hot branches can compare it by identity ("is") instead of by value.
+PERISHABLE = sys.intern("Perishable")
+DURABLE = sys.intern("Durable")
+
+
+# Expiry dates repeat heavily when seeding inventory, so parsed values are cached
+@lru_cache(maxsize=4096)
+def _parse_ymd(text):
+    """
+    Parses a 'YYYY-MM-DD' string into a datetime.
+
+    The zero-padded form is split by hand; anything else (e.g. '2025-1-5')
+    goes through strptime, so the accepted inputs are exactly those of
+    strptime(text, "%Y-%m-%d").
+
+    Raises:
+        ValueError: If the text is not a valid date in that format.
+    """
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        year, month, day = text[0:4], text[5:7], text[8:10]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return datetime(int(year), int(month), int(day)) # Validates month/day ranges
+    return datetime.strptime(text, "%Y-%m-%d")
+
+
+# Save files written before the classes had __slots__ pickled a plain __dict__
+def _restore_slots(obj, state):
+    """
+    Sets the attributes of a __slots__ object from its pickled state.
+
+    Accepts both the (dict, slots dict) pair pickle produces for slotted
+    objects and the plain attribute dict of older saves.
+
+    Returns:
+        bool: True if the state was an old plain dict (callers migrate it).
+    """
+    old = type(state) is dict
+    if not old:
+        dict_state, slot_state = state
+        state = {**(dict_state or {}), **(slot_state or {})}
+    for name, value in state.items():
+        setattr(obj, name, value)
+    return old
+
+
 class Product(ABC):
     """
     Abstract Base Class for all products in the warehouse system.
@@ -38,6 +92,10 @@ class Product(ABC):
         weight_kg (float): Weight in kilograms.
     """
 
+    # Fixed attribute layout: no per-instance __dict__ for large inventories
+    __slots__ = ("_product_id", "_name", "_base_price", "_volume_m3", "_weight_kg",
+                 "_daily_cost", "_info")
+
     def __init__(self, product_id, name, base_price, volume_m3, weight_kg):
         """
         Initializes the product with validation logic to prevent invalid data.
@@ -58,15 +116,14 @@ class Product(ABC):
         self._base_price = base_price
         self._volume_m3 = volume_m3
         self._weight_kg = weight_kg
-
-        # Basic validation to prevent invalid products
-        if self._base_price < 0:
-            raise ValueError("Product price cannot be negative.")
-        
-        if self._volume_m3 <= 0:
-            raise ValueError("Volume must be a positive value.")
-            
-        if self._weight_kg <= 0:
+        self._info = None # Static part of get_product_info(), built on first use
+
+        # Basic validation to prevent invalid products (one short-circuit chain when valid)
+        if base_price < 0 or volume_m3 <= 0 or weight_kg <= 0:
+            if base_price < 0:
+                raise ValueError("Product price cannot be negative.")
+            if volume_m3 <= 0:
+                raise ValueError("Volume must be a positive value.")
             raise ValueError("Weight must be a positive value.")
 
     # getters
@@ -87,6 +144,7 @@ class Product(ABC):
         if not new_name:
             raise ValueError("Product name cannot be empty.")
         self._name = new_name
+        self._info = None # The cached info text contains the name
 
     # Base price with protection against invalid values
     @property
@@ -118,13 +176,24 @@ class Product(ABC):
         """Returns weight in kilograms."""
         return self._weight_kg
 
-    # Each product must declare its category/type
+    @property
+    def daily_storage_cost(self):
+        """Returns the storage cost for one day (precomputed by each subclass)."""
+        return self._daily_cost
+
+    # Each product must declare its category/type.
+    # Subclasses satisfy this with a plain class constant (e.g. product_type = "Durable").
     @property
     @abstractmethod
     def product_type(self):
         """Abstract property: Returns the string category of the product."""
         pass
 
+    # Unrounded cost, so aggregations can round once at the end
+    def _raw_storage_cost(self, days):
+        """Returns the storage cost for the given number of days without rounding."""
+        return self._daily_cost * days
+
     # Polymorphic method: storage cost depends on product type
     @abstractmethod
     def calculate_storage_cost(self, days):
@@ -133,8 +202,20 @@ class Product(ABC):
 
     # Returns a formatted string describing the product
     @abstractmethod
-    def get_product_info(self):
-        """Abstract method: Returns a detailed string summary of the product."""
+    def get_product_info(self, now=None):
+        """
+        Abstract method: Returns a detailed string summary of the product.
+
+        Args:
+            now (datetime): Optional shared 'current time' so a whole report
+                reads the clock once instead of once per product.
+        """
+        pass
+
+    # Short text for the GUI's inventory table
+    @abstractmethod
+    def get_display_info(self, now=None):
+        """Abstract method: Returns the one-line type-specific detail shown in tables."""
         pass
 
 
@@ -147,6 +228,11 @@ class PerishableProduct(Product):
     'FRESH'
     """
 
+    __slots__ = ("_expiry_date", "_req_temperature_c", "_is_spoiled",
+                 "_status_cache", "_status_cache_at", "_display")
+
+    STATUS_TTL = 60.0 # Seconds a clock-based status is reused (status changes over hours)
+
     def __init__(self, product_id, name, base_price, volume_m3, weight_kg, expiry_date, req_temperature_c):
         """
         Initializes a perishable product and parses the expiration date.
@@ -158,31 +244,70 @@ class PerishableProduct(Product):
         super().__init__(product_id, name, base_price, volume_m3, weight_kg)
         
         try:
-            self._expiry_date = datetime.strptime(expiry_date, "%Y-%m-%d") # Use %Y %m %d standard
+            self._expiry_date = _parse_ymd(expiry_date) # Same result as strptime "%Y-%m-%d"
         except ValueError:
             raise ValueError("Date must be in YYYY-MM-DD format.")
 
         self._req_temperature_c = req_temperature_c
         self._is_spoiled = False
+        self._status_cache = None # Last status computed from the real clock
+        self._status_cache_at = 0.0 # time.monotonic() of that computation
+        self._display = None # Static part of get_display_info(), built on first use
 
-    @property
-    def product_type(self):
-        return "Perishable"
+        # Depends only on read-only attributes, so it is computed once here
+        base_rate = 5.0
+        if req_temperature_c > 0:
+            energy_factor = 1.5 # Standard Cooling
+        else:
+            energy_factor = 3.0 # Deep Freeze
+        self._daily_cost = volume_m3 * base_rate + weight_kg * 0.1 * energy_factor
+
+    product_type = PERISHABLE # Class constant, no property call on hot paths
+    _IS_PERISHABLE = True # Type flag for inner loops (a bool test, no string compare)
+
+    def __setstate__(self, state):
+        if not _restore_slots(self, state):
+            return
+        # Saved before __slots__ (a plain __dict__): rebuild through __init__
+        self.__init__(self._product_id, self._name, self._base_price, self._volume_m3,
+                      self._weight_kg, self._expiry_date.strftime("%Y-%m-%d"),
+                      self._req_temperature_c)
+        self._is_spoiled = state["_is_spoiled"]
 
     @property
     def expiry_date(self):
         """Returns the expiration datetime object."""
         return self._expiry_date
 
+    @property
+    def req_temperature_c(self):
+        """Returns the required storage temperature in Celsius."""
+        return self._req_temperature_c
+
     # Checks freshness based on current time
-    def check_status(self):
+    def check_status(self, now=None):
         """
         Determines if product is FRESH, CRITICAL (expiring soon), or EXPIRED.
+
+        Args:
+            now (datetime): Reference time; defaults to datetime.now().
+                Without it, the result is reused for up to STATUS_TTL seconds.
         
         Returns:
             str: Status string.
         """
-        current_time = datetime.now()
+        if now is not None:
+            return self._status_at(now)
+
+        tick = time.monotonic()
+        # A negative age means the stamp came from another process (e.g. a loaded save)
+        if self._status_cache is None or not 0 <= tick - self._status_cache_at < self.STATUS_TTL:
+            self._status_cache = self._status_at(datetime.now())
+            self._status_cache_at = tick
+        return self._status_cache
+
+    def _status_at(self, current_time):
+        """Computes the status for an explicit reference time."""
         if current_time > self._expiry_date:
             self._is_spoiled = True
             return "EXPIRED"
@@ -197,25 +322,25 @@ class PerishableProduct(Product):
         Calculates cost based on volume and energy usage for cooling.
         Deep freeze items (temp <= 0) cost more.
         """
-        base_rate = 5.0
-        if self._req_temperature_c > 0:
-            energy_factor = 1.5 # Standard Cooling
-        else:
-            energy_factor = 3.0 # Deep Freeze
-        
-        volume_cost = self.volume_m3 * base_rate 
-        energy_cost = self.weight_kg * 0.1 * energy_factor
-        
-        return round((volume_cost + energy_cost) * days, 2) # Round to 2 decimals
+        return round(self._raw_storage_cost(days), 2) # Round to 2 decimals
 
-    def get_product_info(self):
+    def get_product_info(self, now=None):
         """Returns detailed info including expiry and temp."""
-        status = self.check_status()
-        return (
-            f"[Perishable] ID: {self.product_id} | Name: {self.name} | "
-            f"Expiry: {self._expiry_date.date()} | Temp: {self._req_temperature_c}C | "
-            f"Status: {status}"
-        )
+        info = self._info
+        if info is None: # Everything except the status is fixed, so it is formatted once
+            info = self._info = (
+                f"[Perishable] ID: {self.product_id} | Name: {self.name} | "
+                f"Expiry: {self._expiry_date.date()} | Temp: {self._req_temperature_c}C | "
+                f"Status: "
+            )
+        return info + self.check_status(now)
+
+    def get_display_info(self, now=None):
+        """Returns 'Exp: <date> | <status>' for the inventory table."""
+        display = self._display
+        if display is None:
+            display = self._display = f"Exp: {self._expiry_date.date()} | "
+        return display + self.check_status(now)
 
 
 class DurableProduct(Product):
@@ -227,6 +352,8 @@ class DurableProduct(Product):
     'Durable'
     """
 
+    __slots__ = ("_material_type", "_is_fragile")
+
     def __init__(self, product_id, name, base_price, volume_m3, weight_kg, material_type, is_fragile):
         """
         Initializes a durable product.
@@ -239,27 +366,41 @@ class DurableProduct(Product):
         self._material_type = material_type
         self._is_fragile = is_fragile
 
-    @property
-    def product_type(self):
-        return "Durable"
+        # Depends only on read-only attributes, so it is computed once here
+        base_rate = 2.0
+        daily_cost = volume_m3 * base_rate
+        if is_fragile: # Fragile product needs a safer environment
+            daily_cost *= 1.20
+        self._daily_cost = daily_cost
+
+    product_type = DURABLE # Class constant, no property call on hot paths
+    _IS_PERISHABLE = False
+
+    def __setstate__(self, state):
+        if not _restore_slots(self, state):
+            return
+        # Saved before __slots__ (a plain __dict__): rebuild through __init__
+        self.__init__(self._product_id, self._name, self._base_price, self._volume_m3,
+                      self._weight_kg, self._material_type, self._is_fragile)
 
     def calculate_storage_cost(self, days):
         """
         Calculates cost based on volume. Fragile items incur a 20% surcharge.
         """
-        base_rate = 2.0
-        daily_cost = self.volume_m3 * base_rate
-        
-        if self._is_fragile: # Fragile product needs a safer environment
-            daily_cost *= 1.20 
+        return round(self._raw_storage_cost(days), 2)
 
-        return round(daily_cost * days, 2)
+    def get_product_info(self, now=None):
+        """Returns detailed info including material and fragility (no time dependence)."""
+        info = self._info
+        if info is None: # Fully static, so it is formatted once
+            fragility = "Fragile" if self._is_fragile else "Robust"
+            info = self._info = (f"[Durable] ID: {self.product_id} | Name: {self.name} | "
+                f"Material: {self._material_type} | Type: {fragility}")
+        return info
 
-    def get_product_info(self):
-        """Returns detailed info including material and fragility."""
-        fragility = "Fragile" if self._is_fragile else "Robust"
-        return (f"[Durable] ID: {self.product_id} | Name: {self.name} | "
-            f"Material: {self._material_type} | Type: {fragility}")
+    def get_display_info(self, now=None):
+        """Returns 'Mat: <material>' for the inventory table."""
+        return f"Mat: {self._material_type}"
 
 
 class InventoryManager:
@@ -270,7 +411,99 @@ class InventoryManager:
 
     def __init__(self):
         self._inventory = {} # Dictionary linking ID to product
-        self._category_count = {"Perishable": 0, "Durable": 0}
+
+        # Columnar (struct-of-arrays) mirror of the registry, one set per category.
+        # Aggregations run over these flat C arrays instead of walking objects.
+        self._row_of = {} # Dictionary linking ID to (is_perishable, row index)
+        self._per_ids = []
+        self._per_price = array("d")
+        self._per_daily = array("d") # Precomputed daily storage cost
+        self._expiry_watch = [] # (expiry POSIX timestamp, ID) for perishables, kept sorted
+        self._dur_ids = []
+        self._dur_price = array("d")
+        self._dur_daily = array("d")
+        self._daily_storage_cost = None # Cached column total, reset on add/remove
+        self._by_name = {} # Secondary index: name -> products registered under it
+        self._version = 0 # Bumped on every add/remove/price change
+        self._total_value = 0.0 # Running sum of base prices, adjusted on every mutation
+
+    @property
+    def version(self):
+        """Counter that changes whenever products are added, removed or repriced."""
+        return self._version
+
+    # Category counts are simply the column lengths
+    @property
+    def _category_count(self):
+        """Returns the number of products per category."""
+        return {PERISHABLE: len(self._per_ids), DURABLE: len(self._dur_ids)}
+
+    # Saves made before the columns existed only pickled the product dict and counts
+    def __setstate__(self, state):
+        if "_row_of" in state:
+            self.__dict__.update(state)
+            return
+        self.__init__()
+        self.bulk_add(state["_inventory"].values()) # Rebuilds the columns and indexes
+
+    # Appends the product's numeric fields to its category columns
+    def _append_row(self, product):
+        """Adds one row to the columns of the product's category."""
+        self._daily_storage_cost = None
+        self._version += 1
+        self._total_value += product.base_price
+        if product._IS_PERISHABLE:
+            self._row_of[product.product_id] = (True, len(self._per_ids))
+            self._per_ids.append(product.product_id)
+            self._per_price.append(product.base_price)
+            self._per_daily.append(product.daily_storage_cost)
+            insort(self._expiry_watch, (product.expiry_date.timestamp(), product.product_id))
+        else:
+            self._row_of[product.product_id] = (False, len(self._dur_ids))
+            self._dur_ids.append(product.product_id)
+            self._dur_price.append(product.base_price)
+            self._dur_daily.append(product.daily_storage_cost)
+
+    # Removes a row in O(1) by moving the last row into its slot
+    def _drop_row(self, product):
+        """Deletes the row of a product from its category columns."""
+        product_id = product.product_id
+        self._daily_storage_cost = None
+        self._version += 1
+        is_perishable, row = self._row_of.pop(product_id)
+        if is_perishable:
+            ids = self._per_ids
+            columns = (self._per_price, self._per_daily)
+            watch = self._expiry_watch
+            del watch[bisect_left(watch, (product.expiry_date.timestamp(), product_id))]
+        else:
+            ids = self._dur_ids
+            columns = (self._dur_price, self._dur_daily)
+
+        self._total_value -= columns[0][row] # Price column comes first
+        if not self._row_of: # Empty again: drop any accumulated float drift
+            self._total_value = 0.0
+
+        last = len(ids) - 1
+        if row != last: # Fill the hole with the last row
+            ids[row] = ids[last]
+            for col in columns:
+                col[row] = col[last]
+            self._row_of[ids[row]] = (is_perishable, row)
+        ids.pop()
+        for col in columns:
+            col.pop()
+
+    # Drops a product from the name index (it is normally filed under its current name)
+    def _unindex_name(self, product):
+        """Removes one product from the secondary name index."""
+        name = product.name
+        if product not in self._by_name.get(name, ()): # Renamed after registration
+            name = next(n for n, same_name in self._by_name.items() if product in same_name)
+        same_name = self._by_name[name]
+        same_name.remove(product)
+        if not same_name:
+            del self._by_name[name]
 
     # Adds a product if the ID is unique
     def add_product(self, product):
@@ -284,11 +517,37 @@ class InventoryManager:
             print(f"[WARNING]: Add Failed: Product ID {product.product_id} already exists.")
             return False
         self._inventory[product.product_id] = product
-        self._category_count[product.product_type] += 1 # Increment count
+        self._append_row(product) # Also updates the category count
+        self._by_name.setdefault(product.name, []).append(product)
         
         print(f"[INFO]: Product Added: {product.name} (ID: {product.product_id})")
         return True
 
+    # Registers many products with a single summary line instead of one print per item
+    def bulk_add(self, products):
+        """
+        Registers a batch of products (e.g. when seeding from a file).
+
+        Products whose ID already exists (in the inventory or earlier in the
+        batch) are skipped, exactly like add_product.
+
+        Returns:
+            int: Number of products actually added.
+        """
+        inventory = self._inventory
+        added = skipped = 0
+        for product in products:
+            if product.product_id in inventory: # Prevent duplicating products
+                skipped += 1
+                continue
+            inventory[product.product_id] = product
+            self._append_row(product)
+            self._by_name.setdefault(product.name, []).append(product)
+            added += 1
+
+        print(f"[INFO]: Bulk Added: {added} products ({skipped} duplicate IDs skipped)")
+        return added
+
     # Removes a product safely by ID
     def remove_product(self, product_id):
         """
@@ -301,7 +560,8 @@ class InventoryManager:
             print(f"[ERROR]: Remove Failed: Product ID {product_id} not found.")
             return False
         product = self._inventory.pop(product_id) 
-        self._category_count[product.product_type] -= 1 # Decrement count
+        self._drop_row(product) # Also updates the category count
+        self._unindex_name(product)
         
         print(f"[INFO]: Product Removed: {product.name} (ID: {product_id})")
         return True
@@ -313,6 +573,37 @@ class InventoryManager:
         """
         return self._inventory.get(product_id) 
 
+    # Names are not unique, so the first registered product with the name wins
+    def get_by_name(self, name):
+        """
+        Returns the first product (in registration order) with the given name, or None.
+        """
+        for product in self._by_name.get(name, ()):
+            if product.name == name: # Skip products renamed since they were added
+                return product
+        # Rare path: the product was renamed after registration
+        return next((p for p in self._inventory.values() if p.name == name), None)
+
+    def iter_products(self):
+        """Returns a live read-only view of all products (no copy is made)."""
+        return self._inventory.values()
+
+    def contains_all(self, product_ids):
+        """Returns True if every ID in the given set is in the inventory."""
+        return product_ids <= self._inventory.keys() # Set comparison runs in C
+
+    def get_products_bulk(self, product_ids):
+        """
+        Looks up many IDs at once.
+
+        Returns:
+            tuple: (dict of found ID -> Product, set of missing IDs)
+        """
+        inventory = self._inventory
+        wanted = set(product_ids)
+        found = {pid: inventory[pid] for pid in wanted if pid in inventory}
+        return found, wanted - found.keys()
+
     # Updates price while respecting product validation
     def update_product_price(self, product_id, new_price):
         """
@@ -326,6 +617,11 @@ class InventoryManager:
         try:
             old_price = product.base_price # Save old price
             product.base_price = new_price # Plug in new price
+            is_perishable, row = self._row_of[product_id]
+            prices = self._per_price if is_perishable else self._dur_price
+            self._total_value += new_price - prices[row]
+            prices[row] = new_price # Keep the price column in sync
+            self._version += 1
             print(f"[INFO]: Price updated for {product_id}: {old_price} -> {new_price}")
             return True
         except ValueError as e:
@@ -335,41 +631,106 @@ class InventoryManager:
     # Calculates total value of inventory (base prices)
     def get_total_inventory_value(self):
         """Sum of all base prices in inventory."""
-        return round(sum(p.base_price for p in self._inventory.values()), 2)
+        return round(self._total_value, 2) # Maintained incrementally, O(1)
 
     # Identifies perishable products close to expiration
     def check_expiring_products(self):
         """Returns a list of warning strings for expired/critical items."""
+        watch = self._expiry_watch
+        now = time.time() # One clock read for the whole scan
+        critical_cutoff = now + 3 * 86400 # Same 3-day window as check_status()
+        # The watchlist is sorted, so only the prefix expiring before the cutoff is visited
+        end = bisect_left(watch, (critical_cutoff,))
+
         warnings = []
-        for p in self._inventory.values():
-            if p.product_type == "Perishable":
-                status = p.check_status()
-                if status in {"EXPIRED", "CRITICAL"}:
-                    warnings.append(f"WARNING: {p.name} is {status}")
+        for expires_at, product_id in watch[:end]: # Soonest expiry first
+            status = "EXPIRED" if expires_at < now else "CRITICAL"
+            warnings.append(f"WARNING: {self._inventory[product_id].name} is {status}")
         return warnings
 
-    # Uses polymorphism to calculate storage costs
+    # Sums each product's precomputed daily cost, stored as a column
     def calculate_total_projected_storage_cost(self, days):
         """Calculates total expected cost for all items over X days."""
-        total_cost = sum(p.calculate_storage_cost(days) for p in self._inventory.values())
-        print(f"[INFO]: Projected storage cost for {days} days: ${total_cost}")
-        return total_cost 
+        if self._daily_storage_cost is None: # Only re-sum after a mutation
+            self._daily_storage_cost = sum(self._per_daily) + sum(self._dur_daily)
+        total_cost = self._daily_storage_cost * days # Rounded only at the boundary
+        print(f"[INFO]: Projected storage cost for {days} days: ${total_cost:.2f}")
+        return round(total_cost, 2)
+
+    # Column-oriented export for analytics tools (e.g. pandas.DataFrame(columns))
+    def to_columns(self):
+        """
+        Returns the inventory as a dict of equal-length column lists:
+        id, name, type, base_price, volume, weight, expiry, temp, fragile.
+        Fields that do not apply to a product's category are None.
+        """
+        columns = {key: [] for key in ("id", "name", "type", "base_price", "volume",
+                                       "weight", "expiry", "temp", "fragile")}
+        for p in self._inventory.values():
+            columns["id"].append(p.product_id)
+            columns["name"].append(p.name)
+            columns["type"].append(p.product_type)
+            columns["base_price"].append(p.base_price)
+            columns["volume"].append(p.volume_m3)
+            columns["weight"].append(p.weight_kg)
+            if p._IS_PERISHABLE:
+                columns["expiry"].append(p.expiry_date)
+                columns["temp"].append(p.req_temperature_c)
+                columns["fragile"].append(None)
+            else:
+                columns["expiry"].append(None)
+                columns["temp"].append(None)
+                columns["fragile"].append(p._is_fragile)
+        return columns
+
+    # Yields the inventory summary line by line (nothing is buffered)
+    def iter_report_lines(self, products=None):
+        """
+        Generates the lines of the inventory report lazily.
+
+        Args:
+            products (list): Optional snapshot of the products to report on (e.g.
+                taken before handing the report to another thread). Defaults
+                to the live inventory.
+        """
+        now = datetime.now() # One clock read shared by every product line
+        if products is None:
+            products = self._inventory.values()
+            perishables = self._category_count['Perishable']
+        else:
+            perishables = sum(1 for p in products if p._IS_PERISHABLE)
+        yield "\n" + "=" * 50
+        yield f"SCWOS INVENTORY REPORT - {now.date()}"
+        yield "=" * 50
+        yield f"Total Items: {len(products)}"
+        yield f"Perishables: {perishables}"
+        yield f"Durables:    {len(products) - perishables}"
+        yield "-" * 50
+        for p in products:
+            yield p.get_product_info(now)
+        yield "=" * 50 + "\n"
 
     # Generates an inventory summary
-    def generate_report(self):
-        """Returns a formatted report of all items and counts."""
-        lines = []
-        lines.append("\n" + "=" * 50)
-        lines.append(f"SCWOS INVENTORY REPORT - {datetime.now().date()}")
-        lines.append("=" * 50)
-        lines.append(f"Total Items: {len(self._inventory)}")
-        lines.append(f"Perishables: {self._category_count['Perishable']}")
-        lines.append(f"Durables:    {self._category_count['Durable']}")
-        lines.append("-" * 50)
-        for p in self._inventory.values():
-            lines.append(p.get_product_info())
-        lines.append("=" * 50 + "\n")
-        return "\n".join(lines)
+    def generate_report(self, products=None):
+        """Returns a formatted report of all items (or of a snapshot, see iter_report_lines) and counts."""
+        return "\n".join(self.iter_report_lines(products))
+
+    # Streams the report to a file-like object in chunks instead of one giant string
+    def write_report(self, stream=None, chunk_size=4096):
+        """
+        Writes the report to 'stream' (default: sys.stdout), joining at most
+        'chunk_size' lines per write() call.
+        """
+        if stream is None:
+            stream = sys.stdout
+        chunk = []
+        for line in self.iter_report_lines():
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                stream.write("\n".join(chunk) + "\n")
+                chunk = []
+        if chunk:
+            stream.write("\n".join(chunk) + "\n")
 
 
 # ==============================================================================
@@ -391,6 +752,9 @@ class StorageLocation(ABC):
         current_load (float): Current weight stored.
     """
 
+    # Fixed attribute layout, like Product (no per-instance __dict__)
+    __slots__ = ("location_id", "capacity", "current_load", "items_count", "last_updated")
+
     def __init__(self, location_id, capacity, current_load=0):
         self.location_id = location_id
         self.capacity = capacity
@@ -398,6 +762,11 @@ class StorageLocation(ABC):
         self.items_count = 0
         self.last_updated = None
 
+    ACCEPTS = None # Product kind this location can hold (None: ask is_suitable for any kind)
+
+    def __setstate__(self, state):
+        _restore_slots(self, state) # Old saves used the same attribute names
+
     @abstractmethod
     def is_suitable(self, product):
         """Abstract method: checks if a product type fits this location."""
@@ -407,34 +776,26 @@ class StorageLocation(ABC):
         """
         Attempts to add an item. Checks suitability and weight capacity.
         """
-        suitable = self.is_suitable(product)
-        if suitable:
-            # Note: Uses 'weight_kg' from Role 1 Product class
-            product_weight = product.weight_kg 
-            current_load = self.current_load
-            new_load = current_load + product_weight
-            
-            if new_load <= self.capacity: # Capacity check
-                self.current_load = new_load
-                self.items_count += 1
-                self.last_updated = datetime.now()
-                return True
-        return False
+        if not self.is_suitable(product):
+            return False
+
+        # Note: Uses 'weight_kg' from Role 1 Product class (read once into a local)
+        new_load = self.current_load + product.weight_kg
+        if new_load > self.capacity: # Capacity check
+            return False
+
+        self.current_load = new_load
+        self.items_count += 1
+        self.last_updated = datetime.now()
+        return True
 
     def remove_item(self, product):
         """Removes an item and updates load calculations."""
-        product_weight = product.weight_kg
-        current_load = self.current_load
-        new_load = current_load - product_weight
-        
-        if new_load < 0:
-            self.current_load = 0
-        else:
-            self.current_load = new_load
-            
-        self.items_count -= 1
-        if self.items_count < 0:
-            self.items_count = 0
+        new_load = self.current_load - product.weight_kg
+        self.current_load = new_load if new_load > 0 else 0
+
+        items_count = self.items_count - 1
+        self.items_count = items_count if items_count > 0 else 0
         self.last_updated = datetime.now()
 
     def get_remaining_capacity(self):
@@ -450,16 +811,20 @@ class Shelf(StorageLocation):
     Standard dry storage shelf for Durable products.
     """
 
+    __slots__ = ("max_height",)
+
     def __init__(self, location_id, capacity, current_load, max_height):
         super().__init__(location_id, capacity, current_load)
         self.max_height = max_height
 
+    ACCEPTS = DURABLE
+
     def is_suitable(self, product):
         """
         Checks if the product is Durable and fits physically.
         """
-        # Check type (Role 1 Integration)
-        if not isinstance(product, DurableProduct):
+        # Check type (Role 1 Integration) via the class-level flag, no MRO walk
+        if product._IS_PERISHABLE:
             return False
 
         # Note: Ideally checks height, but here checks weight as proxy in original logic
@@ -475,23 +840,26 @@ class RefrigeratedUnit(StorageLocation):
     Temperature-controlled unit for Perishable products.
     """
 
+    __slots__ = ("min_temp", "max_temp")
+
     def __init__(self, location_id, capacity, min_temp, max_temp):
         super().__init__(location_id, capacity, current_load=0)
         self.min_temp = min_temp
         self.max_temp = max_temp
 
+    ACCEPTS = PERISHABLE
+
     def is_suitable(self, product):
         """
         Checks if the product is Perishable and requires this temp range.
         """
-        # Check type (Role 1 Integration)
-        if not isinstance(product, PerishableProduct):
+        # Check type (Role 1 Integration) via the class-level flag, no MRO walk
+        if not product._IS_PERISHABLE:
             return False
 
-        # Check temperature directly (Accessing Role 1 private attribute)
-        if product._req_temperature_c < self.min_temp:
-            return False
-        if product._req_temperature_c > self.max_temp:
+        # Check temperature through the public Role 1 property (read once)
+        temp = product.req_temperature_c
+        if temp < self.min_temp or temp > self.max_temp:
             return False
 
         # Check weight
@@ -509,10 +877,32 @@ class Warehouse:
     def __init__(self, name):
         self.name = name
         self.locations = [] # List of StorageLocation objects
+        self._by_id = {} # Dictionary linking location ID to location (O(1) lookup)
+        # Locations bucketed by the product kind they accept, in registration order
+        self._by_kind = {DURABLE: [], PERISHABLE: []}
+
+    # Saves made before the ID index existed only pickled the name and locations
+    def __setstate__(self, state):
+        if "_by_id" in state:
+            self.__dict__.update(state)
+            return
+        self.__init__(state["name"])
+        for location in state["locations"]:
+            self.add_location(location)
 
     def add_location(self, location):
         """Registers a new storage location."""
         self.locations.append(location)
+        self._by_id[location.location_id] = location # Later duplicates win, as before
+        if location.ACCEPTS is None: # Unknown kind: candidate for every product
+            for bucket in self._by_kind.values():
+                bucket.append(location)
+        else:
+            self._by_kind[location.ACCEPTS].append(location)
+
+    def locations_for(self, kind):
+        """Returns the locations that can hold the given product kind, in registration order."""
+        return self._by_kind[kind]
 
     def get_free_capacity(self):
         """Aggregates free capacity across all locations."""
@@ -530,11 +920,7 @@ class Warehouse:
 
     def find_location_by_id(self, location_id):
         """Finds a specific location object by its ID."""
-        found = None
-        for loc in self.locations:
-            if loc.location_id == location_id:
-                found = loc
-        return found
+        return self._by_id.get(location_id)
 
 
 class OptimizationEngine:
@@ -553,7 +939,8 @@ class OptimizationEngine:
         """
         selected_location = None
 
-        for loc in self.warehouse.locations:
+        # Only locations of the right kind are tried (same first-fit order as before)
+        for loc in self.warehouse.locations_for(product.product_type):
             suitable = loc.is_suitable(product)
             if suitable is True:
                 selected_location = loc
@@ -561,6 +948,55 @@ class OptimizationEngine:
 
         return selected_location
 
+    def find_best_locations(self, products):
+        """
+        Bulk version of find_best_location for placing many products at once.
+
+        Current loads are snapshotted once per location into flat arrays and
+        each product is matched first-fit with inline type/temperature/weight
+        checks instead of an is_suitable() call per location. Weight assigned
+        earlier in the batch is added to the projected load, and the weight
+        test is the same 'load + weight <= capacity' as add_item, so the plan
+        equals placing the products one by one (no free-space rounding drift).
+
+        Returns:
+            list: One StorageLocation (or None) per product, in input order.
+        """
+        shelves = [loc for loc in self.warehouse.locations_for(DURABLE) if isinstance(loc, Shelf)]
+        fridges = [loc for loc in self.warehouse.locations_for(PERISHABLE)
+                   if isinstance(loc, RefrigeratedUnit)]
+
+        shelf_cap = array("d", [loc.capacity for loc in shelves])
+        shelf_load = array("d", [loc.current_load for loc in shelves])
+        fridge_cap = array("d", [loc.capacity for loc in fridges])
+        fridge_load = array("d", [loc.current_load for loc in fridges])
+        fridge_min = array("d", [loc.min_temp for loc in fridges])
+        fridge_max = array("d", [loc.max_temp for loc in fridges])
+
+        plan = []
+        for product in products:
+            weight = product.weight_kg
+            selected_location = None
+
+            if isinstance(product, DurableProduct):
+                for i, load in enumerate(shelf_load):
+                    new_load = load + weight
+                    if new_load <= shelf_cap[i]:
+                        shelf_load[i] = new_load # Reserve for the rest of the batch
+                        selected_location = shelves[i]
+                        break
+            elif isinstance(product, PerishableProduct):
+                temp = product.req_temperature_c
+                for i, load in enumerate(fridge_load):
+                    new_load = load + weight
+                    if new_load <= fridge_cap[i] and fridge_min[i] <= temp <= fridge_max[i]:
+                        fridge_load[i] = new_load
+                        selected_location = fridges[i]
+                        break
+
+            plan.append(selected_location)
+        return plan
+
 
 # ==============================================================================
 # ROLE 3: ORDER & SHIPMENT PROCESSING
@@ -571,57 +1007,396 @@ class OptimizationEngine:
 # - Manage shipments and tracking numbers
 # ==============================================================================
 
+# Events are stamped with an integer time.time_ns() reading (no datetime object
+# per call); they are turned into datetimes only when somebody reads them.
+_now_ns = time.time_ns # Bound once: the stamping paths skip the module attribute lookup
+
+
+def _ns_to_datetime(ns):
+    """Converts a time.time_ns() stamp into a local datetime."""
+    return datetime.fromtimestamp(ns / 1e9)
+
+
+def _datetime_to_ns(moment):
+    """Converts a local datetime (as stored by older saves) into a time.time_ns() stamp."""
+    return int(moment.replace(microsecond=0).timestamp()) * 1_000_000_000 + moment.microsecond * 1000
+
+
+# Tracking codes look like ABC-12345678: 26**3 letter prefixes x 10**8 numbers.
+# One random integer covers the whole code space and is split with divmod;
+# the letter part is looked up in a precomputed table of two-letter pairs.
+_TRACKING_SPACE = 26 ** 3 * 10 ** 8
+_LETTER_PAIRS = tuple(a + b for a in string.ascii_uppercase for b in string.ascii_uppercase)
+
+
+def _random_tracking_code():
+    """Returns one uniformly random tracking code like ABC-12345678."""
+    letters, digits = divmod(random.randrange(_TRACKING_SPACE), 10 ** 8)
+    first, pair = divmod(letters, 676)
+    return f"{string.ascii_uppercase[first]}{_LETTER_PAIRS[pair]}-{digits:08d}"
+
+
+# Codes handed out one at a time come from a pool refilled in batches, so a
+# shipment only pays for a list pop; list.pop is atomic under the GIL
+_TRACKING_POOL = []
+_TRACKING_BATCH = 1024
+
+
+def _next_tracking_code():
+    """Returns the next pre-generated tracking code, refilling the pool when empty."""
+    try:
+        return _TRACKING_POOL.pop()
+    except IndexError:
+        _TRACKING_POOL.extend([_random_tracking_code() for _ in range(_TRACKING_BATCH)])
+        return _TRACKING_POOL.pop()
+
+
+class LogKind(IntEnum):
+    """Log record types, stored as small ints (the names are only looked up on export)."""
+    ORDER_STATUS = 0
+    SHIPMENT_EVENT = 1
+    WARNING = 2
+    INFO = 3
+    ORDER_CANCELLED = 4
+
+
+# Display names indexed by LogKind value
+_TYPE_NAMES = tuple(kind.name for kind in LogKind)
+_ORDER_STATUS, _SHIPMENT_EVENT, _WARNING, _INFO, _ORDER_CANCELLED = LogKind
+
+# Status changes and shipment events are stored as argument tuples and only
+# formatted with their type's template when the text is actually needed
+_TEMPLATES = ("Order %s changed status to %s", "Shipment %s: %s", None, None,
+              "Order %s cancelled: %s")
+
+
+def _format_message(type_id, message):
+    """Returns the text of a stored message (a plain string or a template args tuple)."""
+    if type(message) is tuple:
+        return _TEMPLATES[type_id] % message
+    return message
+
+
 class TransactionLogger:
     """
     Centralized logger used by orders and shipments.
-    Keeps a protected list (_records) so logs cannot be modified outside this class.
+    Keeps protected columns (one entry per record) so logs cannot be modified
+    outside this class.
+
+    Optionally mirrors every record to a text sink (any object with
+    writelines(), e.g. an open file). Lines are buffered and written in groups
+    so a burst of status changes costs one write instead of one per event.
+    A timer writes out the group once its oldest line is MAX_DELAY_NS old,
+    even when no further records arrive.
+
+    With background=True, callers only enqueue (stamp, type, message) and a
+    daemon thread stores the records; readers wait for the queue to drain.
+
+    In-memory history is bounded: only the most recent max_records are kept.
     """
 
-    def __init__(self):
-        self._records = []   # hidden list to protect log integrity
+    __slots__ = ("_types", "_messages", "_times", "_sink", "_retain",
+                 "_buffer", "_buffer_chars", "_buffer_since", "_queue", "_lock",
+                 "_max_records", "_dropped", "_timer")
+
+    MAX_BATCH = 1000        # Records per group write
+    MAX_BYTES = 64 * 1024   # Buffered characters per group write
+    MAX_DELAY_NS = 50_000_000  # Oldest buffered record waits at most ~50 ms (timer-enforced)
+
+    def __init__(self, sink=None, retain_memory=True, background=False, max_records=100_000):
+        """
+        Args:
+            sink: Optional object with writelines() that receives formatted lines.
+            retain_memory (bool): Keep records in memory for get_logs/export.
+                Always on when there is no sink, otherwise logs would be lost.
+            background (bool): Store records on a background thread.
+            max_records (int): In-memory history limit (None for unbounded).
+        """
+        # Hidden parallel columns to protect log integrity (struct-of-arrays)
+        self._types = array("B") # Indexes into _TYPE_NAMES
+        self._messages = []
+        self._times = array("q") # time.time_ns() stamps, converted on export
+        self._max_records = max_records
+        self._dropped = 0 # Records discarded from the front so far
+
+        self._sink = sink
+        self._retain = retain_memory or sink is None
+        self._buffer = []
+        self._buffer_chars = 0
+        self._buffer_since = 0
+        self._timer = None # Pending age flush of the sink buffer
+        self._lock = threading.Lock() # Guards the sink buffer
+        self._queue = None
+        if background:
+            self._start_background()
+
+    def _start_background(self):
+        """Creates the record queue and its consumer thread."""
+        self._queue = Queue()
+        threading.Thread(target=self._drain, daemon=True).start()
+
+    # Consumer loop: takes everything queued so far and stores it in one go
+    def _drain(self):
+        queue = self._queue
+        while True:
+            batch = [queue.get()]
+            try:
+                while True:
+                    batch.append(queue.get_nowait())
+            except Empty:
+                pass
+            for record in batch:
+                self._store(*record)
+                queue.task_done()
+
+    def _wait_for_queue(self):
+        """Blocks until the background thread has stored every queued record."""
+        if self._queue is not None:
+            self._queue.join()
 
     # Internal helper to save logs
-    def _add(self, record_type, message):
-        self._records.append({
-            "type": record_type,
-            "message": message,
-            "time": datetime.now()
-        })
+    def _add(self, type_id, message, stamp=None):
+        now = _now_ns() if stamp is None else stamp
+        if self._queue is not None: # Off the caller's path
+            self._queue.put_nowait((now, type_id, message))
+        else:
+            self._store(now, type_id, message)
+
+    # Batch variant of _add: one clock read for many records of the same type
+    def _add_bulk(self, type_id, messages, stamps=None):
+        """
+        Logs several messages of one type.
+
+        Args:
+            stamps: Optional time.time_ns() stamps, one per message (e.g. when
+                the events happened earlier); by default all share one clock read.
+        """
+        if stamps is None:
+            stamps = [_now_ns()] * len(messages)
+        if self._queue is not None:
+            for now, message in zip(stamps, messages):
+                self._queue.put_nowait((now, type_id, message))
+        elif self._sink is None: # Memory only: extend the columns directly
+            self._types.extend(array("B", [type_id]) * len(messages))
+            self._messages.extend(messages)
+            self._times.extend(stamps)
+            self._trim()
+        else:
+            for now, message in zip(stamps, messages):
+                self._store(now, type_id, message)
+
+    def _store(self, now, type_id, message):
+        """Appends one record to the columns and the sink buffer."""
+        if self._retain:
+            self._types.append(type_id)
+            self._messages.append(message)
+            self._times.append(now)
+            self._trim()
+
+        if self._sink is not None:
+            line = f"[{_ns_to_datetime(now)}] ({_TYPE_NAMES[type_id]}) -> {_format_message(type_id, message)}\n"
+            with self._lock:
+                if not self._buffer: # First line of a group: bound how long it can wait
+                    self._buffer_since = now
+                    self._timer = threading.Timer(self.MAX_DELAY_NS / 1e9, self._write_buffer)
+                    self._timer.daemon = True
+                    self._timer.start()
+                self._buffer.append(line)
+                self._buffer_chars += len(line)
+                full = (len(self._buffer) >= self.MAX_BATCH
+                        or self._buffer_chars >= self.MAX_BYTES
+                        or now - self._buffer_since >= self.MAX_DELAY_NS)
+            if full:
+                self._write_buffer()
+
+    # Trims in chunks (25% slack) so the O(n) front deletion is amortized O(1) per record
+    def _trim(self):
+        """Drops the oldest records once the history exceeds its limit."""
+        limit = self._max_records
+        if limit is None or len(self._types) <= limit + limit // 4:
+            return
+        excess = len(self._types) - limit
+        del self._types[:excess]
+        del self._messages[:excess]
+        del self._times[:excess]
+        self._dropped += excess
+
+    def _write_buffer(self):
+        """Writes all buffered lines to the sink in a single call."""
+        with self._lock:
+            if self._timer is not None: # Written now, so the age flush is not needed
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer:
+                return
+            self._sink.writelines(self._buffer)
+            if hasattr(self._sink, "flush"):
+                self._sink.flush()
+            self._buffer = []
+            self._buffer_chars = 0
+
+    def flush(self):
+        """Stores any queued records, then writes buffered lines to the sink."""
+        self._wait_for_queue()
+        self._write_buffer()
+
+    # Open files, locks, timers and threads cannot be pickled: flush and drop them when saving
+    def __getstate__(self):
+        self.flush()
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["_sink"] = None
+        state["_retain"] = True
+        state["_lock"] = None
+        state["_timer"] = None
+        state["_queue"] = self._queue is not None # Restarted on load
+        return state
+
+    def __setstate__(self, state):
+        if "_records" in state: # Saved before the columnar layout: convert the record dicts
+            self.__init__()
+            for record in state["_records"]:
+                self._types.append(_TYPE_NAMES.index(record["type"]))
+                self._messages.append(record["message"])
+                self._times.append(_datetime_to_ns(record["time"]))
+            self._trim()
+            return
+        background = state.pop("_queue")
+        state.setdefault("_max_records", 100_000) # Older pickles predate the limit
+        state.setdefault("_dropped", 0)
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._lock = threading.Lock()
+        self._timer = None
+        self._queue = None
+        if background:
+            self._start_background()
 
     def log_order_status(self, order_id, status):
         """Logs a change in order status."""
-        self._add(
-            "ORDER_STATUS",
-            f"Order {order_id} changed status to {status}"
-        )
-
-    def log_shipment_event(self, shipment_id, event):
-        """Logs an event related to a specific shipment."""
-        self._add(
-            "SHIPMENT_EVENT",
-            f"Shipment {shipment_id}: {event}"
+        self._add(_ORDER_STATUS, (order_id, status))
+
+    def log_order_cancelled(self, order_id, reason):
+        """Logs a cancellation (status change and reason) as a single record."""
+        self._add(_ORDER_CANCELLED, (order_id, reason))
+
+    def log_shipment_event(self, shipment_id, event, stamp=None):
+        """Logs an event related to a specific shipment (stamp: optional time.time_ns() of the event)."""
+        self._add(_SHIPMENT_EVENT, (shipment_id, event), stamp)
+
+    def log_shipment_events(self, shipment_id, events, stamps=None):
+        """Logs several events of one shipment in a single batch (stamps: optional, one per event)."""
+        self._add_bulk(
+            _SHIPMENT_EVENT,
+            [(shipment_id, event) for event in events],
+            stamps
         )
 
     def log_warning(self, message):
         """Logs a generic warning."""
-        self._add("WARNING", message)
+        self._add(_WARNING, message)
 
     def log_info(self, message):
         """Logs a generic info message."""
-        self._add("INFO", message)
-
-    def get_logs(self):
-        """Expose logs read-only as a tuple."""
-        return tuple(self._records)
-
-    def export_as_text(self):
-        """Return formatted logs as multi-line text."""
-        lines = []
-        for r in self._records:
-            lines.append(
-                f"[{r['time']}] ({r['type']}) -> {r['message']}"
-            )
-        return "\n".join(lines)
+        self._add(_INFO, message)
+
+    def get_logs(self, kind=None):
+        """
+        Expose logs read-only as a tuple of record dicts (built on demand).
+
+        Args:
+            kind (LogKind): Optional filter; only records of this type are returned.
+                The type column is compared as ints, before any dict is built.
+        """
+        self._wait_for_queue()
+        records = zip(self._types, self._messages, self._times)
+        if kind is not None:
+            records = [record for record in records if record[0] == kind]
+        return tuple(
+            {"type": _TYPE_NAMES[t], "message": _format_message(t, m), "time": _ns_to_datetime(ts)}
+            for t, m, ts in records
+        )
+
+    def export_as_text(self, last=None):
+        """
+        Return formatted logs as multi-line text.
+
+        Args:
+            last (int): Optional limit; only the most recent `last` records are formatted.
+        """
+        self._wait_for_queue()
+        start = 0 if last is None else max(0, len(self._types) - last)
+        return self._format_from(start)
+
+    def export_since(self, position):
+        """
+        Formats only the records logged after an earlier call (for tail-appending views).
+
+        Args:
+            position (int): Position returned by the previous call (0 for everything).
+                Positions count every record ever logged, so they stay valid
+                when old records are trimmed from memory.
+
+        Returns:
+            tuple: (text of the new records, position to pass next time)
+        """
+        self._wait_for_queue()
+        dropped = self._dropped
+        start = max(0, position - dropped)
+        end = dropped + len(self._types)
+        return self._format_from(start), end
+
+    def snapshot(self, last=None):
+        """
+        Copies the retained records into a new memory-only logger, so they can be
+        exported on another thread while this logger keeps recording.
+
+        Args:
+            last (int): Optional limit; only the most recent `last` records are copied.
+        """
+        self._wait_for_queue()
+        start = 0 if last is None else max(0, len(self._types) - last)
+        copy = TransactionLogger(max_records=None)
+        copy._types = self._types[start:]
+        copy._messages = self._messages[start:]
+        copy._times = self._times[start:]
+        return copy
+
+    def _format_from(self, start):
+        """Formats the retained records from index start onwards, one per line."""
+        return "\n".join(
+            f"[{_ns_to_datetime(ts)}] ({_TYPE_NAMES[t]}) -> {_format_message(t, m)}"
+            for t, m, ts in zip(self._types[start:], self._messages[start:], self._times[start:])
+        )
+
+
+# Recurring baskets share one items tuple across orders. Tuples cannot be weakly
+# referenced, so the pool is a plain dict that is simply reset when it gets large.
+_ITEM_POOL = {}
+_ITEM_POOL_MAX = 1024
+
+
+def _shared_items(items):
+    """Returns a pooled tuple equal to tuple(items) (same products, same order)."""
+    key = tuple(items or ())
+    shared = _ITEM_POOL.get(key)
+    if shared is None:
+        if len(_ITEM_POOL) >= _ITEM_POOL_MAX:
+            _ITEM_POOL.clear()
+        _ITEM_POOL[key] = shared = key
+    return shared
+
+
+class OrderStatus(IntEnum):
+    """Order lifecycle states, stored as small ints (see STATUS_NAMES for display)."""
+    PENDING = 0
+    PICKED = 1
+    SHIPPED = 2
+    DELIVERED = 3
+    CANCELLED = 4
+
+
+# Display names indexed by OrderStatus value
+STATUS_NAMES = ("Pending", "Picked", "Shipped", "Delivered", "Cancelled")
 
 
 class CustomerOrder:
@@ -629,13 +1404,30 @@ class CustomerOrder:
     Represents a single order from a customer and manages its lifecycle status.
     """
 
-    VALID_STATUSES = [
+    __slots__ = ("_order_id", "_customer_name", "_items", "_items_count", "_status",
+                 "_created_at", "_logger")
+
+    # Status display names (what the status property returns), as a frozenset
+    VALID_STATUSES = frozenset({
         "Pending",
         "Picked",
         "Shipped",
         "Delivered",
         "Cancelled"
-    ]
+    })
+
+    # Allowed next statuses, indexed by the current OrderStatus value
+    _TRANSITIONS = (
+        frozenset({OrderStatus.PICKED, OrderStatus.CANCELLED}), # Pending
+        frozenset({OrderStatus.SHIPPED, OrderStatus.CANCELLED}), # Picked
+        frozenset({OrderStatus.DELIVERED}), # Shipped
+        frozenset(), # Delivered
+        frozenset({OrderStatus.CANCELLED}), # Cancelled: re-cancelling only logs the reason again
+    )
+
+    # Released orders waiting to be reused by acquire()
+    _pool = []
+    POOL_MAX = 256
 
     def __init__(self, order_id, customer_name, items, logger):
         """
@@ -644,12 +1436,74 @@ class CustomerOrder:
         """
         self._order_id = order_id
         self._customer_name = customer_name
-        self._items = items or []
-        self._status = "Pending"
-        self._created_at = datetime.now()
+        self._items = _shared_items(items) # Immutable, so it can be handed out as-is
+        self._items_count = len(self._items)
+        self._status = OrderStatus.PENDING
+        self._created_at = _now_ns() # Converted to datetime in get_summary
         self._logger = logger
 
-        self._logger.log_order_status(order_id, self._status)
+        self._logger.log_order_status(order_id, STATUS_NAMES[self._status])
+
+    @classmethod
+    def bulk_create(cls, specs, logger):
+        """
+        Creates many Pending orders at once (e.g. when importing order history).
+
+        Args:
+            specs: Iterable of (order_id, customer_name, items) tuples.
+            logger: TransactionLogger shared by all the orders.
+
+        Returns:
+            list: The new CustomerOrder objects, in the same order as specs.
+        """
+        created_at = _now_ns() # One stamp for the whole batch
+        pending = STATUS_NAMES[OrderStatus.PENDING]
+        orders = []
+        messages = []
+        for order_id, customer_name, items in specs:
+            order = cls.__new__(cls)
+            order._order_id = order_id
+            order._customer_name = customer_name
+            order._items = _shared_items(items)
+            order._items_count = len(order._items)
+            order._status = OrderStatus.PENDING
+            order._created_at = created_at
+            order._logger = logger
+            orders.append(order)
+            messages.append((order_id, pending))
+
+        logger._add_bulk(_ORDER_STATUS, messages) # One batched log write
+        return orders
+
+    @classmethod
+    def acquire(cls, order_id, customer_name, items, logger):
+        """Like CustomerOrder(...), but reuses a released order object when one is free."""
+        order = cls._pool.pop() if cls._pool else cls.__new__(cls)
+        order.__init__(order_id, customer_name, items, logger)
+        return order
+
+    def release(self):
+        """
+        Returns a finished (Delivered/Cancelled) order to the pool for reuse.
+
+        Only call this once nothing else holds the order: acquire() will
+        overwrite it in place. Orders are never released automatically.
+        """
+        if self._status not in (OrderStatus.DELIVERED, OrderStatus.CANCELLED):
+            raise ValueError("Only delivered or cancelled orders can be released.")
+        self._items = None
+        self._logger = None
+        if len(self._pool) < self.POOL_MAX:
+            self._pool.append(self)
+
+    def __setstate__(self, state):
+        if type(state) is dict: # Old save: status name, item list and datetime stamp
+            state = dict(state)
+            state["_items"] = _shared_items(state["_items"])
+            state["_items_count"] = len(state["_items"])
+            state["_status"] = OrderStatus(STATUS_NAMES.index(state["_status"]))
+            state["_created_at"] = _datetime_to_ns(state["_created_at"])
+        _restore_slots(self, state)
 
     @property
     def order_id(self):
@@ -657,114 +1511,187 @@ class CustomerOrder:
 
     @property
     def status(self):
-        return self._status
+        return STATUS_NAMES[self._status]
 
     @property
     def items(self):
-        return list(self._items)
+        return self._items
 
     def __repr__(self):
-        return f"<Order #{self._order_id} status={self._status}>"
+        return f"<Order #{self._order_id} status={STATUS_NAMES[self._status]}>"
 
     # Private method to protect status changes
     def _set_status(self, new_status):
-        if new_status not in self.VALID_STATUSES:
+        if not isinstance(new_status, OrderStatus):
             raise ValueError("Invalid status update.")
 
         self._status = new_status
-        self._logger.log_order_status(self._order_id, new_status)
+        self._logger.log_order_status(self._order_id, STATUS_NAMES[new_status])
+
+    def _require_transition(self, new_status, error_message):
+        """Raises ValueError(error_message) if new_status cannot follow the current one."""
+        if new_status not in self._TRANSITIONS[self._status]:
+            raise ValueError(error_message)
 
     # --------------------------------------------------------
     # Uses InventoryManager from Role 1
     # --------------------------------------------------------
     def check_availability(self, inventory):
         """Ensure all products exist in inventory (ignores quantity)."""
-        for p in self._items:
-            # Calls Role 1 InventoryManager
-            stored = inventory.get_product(p.product_id)
-            if stored is None:
-                return False
-        return True
+        # Multi-unit orders repeat IDs, so each distinct product is checked once
+        needed = {p.product_id for p in self._items}
+        # Calls Role 1 InventoryManager
+        return inventory.contains_all(needed)
 
     def start_picking(self, inventory):
         """Transitions order to Picked status if items are available."""
-        if self._status != "Pending":
-            raise ValueError("Order can only be picked from Pending state.")
+        self._require_transition(OrderStatus.PICKED, "Order can only be picked from Pending state.")
 
         if not self.check_availability(inventory):
             raise ValueError(
                 "One or more products are missing from inventory."
             )
 
-        self._set_status("Picked")
+        self._set_status(OrderStatus.PICKED)
         return True
 
     def mark_shipped(self):
         """Transitions order to Shipped status."""
-        if self._status != "Picked":
-            raise ValueError("Order must be picked before shipping.")
-        self._set_status("Shipped")
+        self._require_transition(OrderStatus.SHIPPED, "Order must be picked before shipping.")
+        self._set_status(OrderStatus.SHIPPED)
 
     def mark_delivered(self):
         """Transitions order to Delivered status."""
-        if self._status != "Shipped":
-            raise ValueError("Order must be shipped before delivery.")
-        self._set_status("Delivered")
+        self._require_transition(OrderStatus.DELIVERED, "Order must be shipped before delivery.")
+        self._set_status(OrderStatus.DELIVERED)
+        self._logger.flush() # An order's history is complete once delivered
 
     def cancel(self, reason="User requested"):
         """Allows cancelling only when not shipped/delivered."""
-        if self._status in ("Shipped", "Delivered"):
-            raise ValueError("Cannot cancel after shipping.")
+        self._require_transition(OrderStatus.CANCELLED, "Cannot cancel after shipping.")
 
-        self._set_status("Cancelled")
-        self._logger.log_warning(
-            f"Order {self._order_id} cancelled: {reason}"
-        )
+        # One record carries both the new status and the reason
+        self._status = OrderStatus.CANCELLED
+        self._logger.log_order_cancelled(self._order_id, reason)
 
     def get_summary(self):
         """Return basic order summary as dictionary."""
         return {
             "order_id": self._order_id,
             "customer": self._customer_name,
-            "status": self._status,
-            "created": self._created_at,
-            "items_count": len(self._items),
+            "status": STATUS_NAMES[self._status],
+            "created": _ns_to_datetime(self._created_at),
+            "items_count": self._items_count,
         }
 
 
 class Shipment:
     """
     Connects an order to delivery logistics and generates tracking info.
+
+    flush_mode "immediate" (default) logs every event as it happens;
+    "deferred" keeps events local until flush_events() or delivery, then logs
+    them in one batch.
     """
 
-    def __init__(self, shipment_id, order_ref, carrier, logger):
+    __slots__ = ("_shipment_id", "_order_ref", "_carrier", "_tracking_number",
+                 "_created", "_delivered", "_events", "_logger", "_deferred", "_logged")
+
+    # Released shipments waiting to be reused by acquire()
+    _pool = []
+    POOL_MAX = 256
+
+    def __init__(self, shipment_id, order_ref, carrier, logger, flush_mode="immediate"):
+        if flush_mode not in ("immediate", "deferred"):
+            raise ValueError("flush_mode must be 'immediate' or 'deferred'.")
+        self._deferred = flush_mode == "deferred"
+        self._logged = 0 # Number of _events already sent to the logger
         self._shipment_id = shipment_id
         self._order_ref = order_ref
         self._carrier = carrier
         self._tracking_number = None
-        self._created = datetime.now()
+        self._created = _now_ns()
         self._delivered = False
         self._events = []
         self._logger = logger
 
         self._add_event("Shipment created")
 
+    @classmethod
+    def acquire(cls, shipment_id, order_ref, carrier, logger, flush_mode="immediate"):
+        """Like Shipment(...), but reuses a released shipment object when one is free."""
+        shipment = cls._pool.pop() if cls._pool else cls.__new__(cls)
+        shipment.__init__(shipment_id, order_ref, carrier, logger, flush_mode)
+        return shipment
+
+    def release(self):
+        """
+        Returns a delivered shipment to the pool for reuse.
+
+        Only call this once nothing else holds the shipment: acquire() will
+        overwrite it in place. Shipments are never released automatically.
+        """
+        if not self._delivered:
+            raise ValueError("Only delivered shipments can be released.")
+        self._order_ref = None
+        self._events = None
+        self._logger = None
+        if len(self._pool) < self.POOL_MAX:
+            self._pool.append(self)
+
     def _add_event(self, text):
         """Internal helper for shipment history."""
-        self._events.append(
-            (datetime.now(), text)
-        )
-        self._logger.log_shipment_event(self._shipment_id, text)
+        self._events.append((_now_ns(), text))
+        if not self._deferred:
+            self.flush_events()
+
+    def flush_events(self):
+        """Sends all events not yet logged to the logger in one batch."""
+        pending = self._events[self._logged:]
+        if not pending:
+            return
+        self._logged = len(self._events)
+        # Each record keeps the time its event happened, not the time of the flush
+        if len(pending) == 1:
+            stamp, text = pending[0]
+            self._logger.log_shipment_event(self._shipment_id, text, stamp)
+        else:
+            self._logger.log_shipment_events(self._shipment_id, [text for _, text in pending],
+                                             [stamp for stamp, _ in pending])
+
+    def __setstate__(self, state):
+        if type(state) is dict: # Old save: datetime stamps, every event logged immediately
+            state = dict(state)
+            state["_created"] = _datetime_to_ns(state["_created"])
+            state["_events"] = [(_datetime_to_ns(at), text) for at, text in state["_events"]]
+            state["_deferred"] = False
+            state["_logged"] = len(state["_events"])
+        _restore_slots(self, state)
 
     @property
     def tracking_number(self):
         return self._tracking_number
 
-    def generate_tracking(self):
-        """Generates a random tracking code like ABC-12345678."""
-        letters = "".join(random.choices(string.ascii_uppercase, k=3))
-        digits = "".join(random.choices(string.digits, k=8))
-        self._tracking_number = f"{letters}-{digits}"
+    @staticmethod
+    def bulk_generate_tracking(n):
+        """
+        Generates n tracking codes like ABC-12345678 in one go.
+
+        Each code costs one RNG call plus table lookups (no per-character lists).
+        """
+        return [_random_tracking_code() for _ in range(n)]
+
+    def generate_tracking(self, tracking_number=None):
+        """
+        Generates a random tracking code like ABC-12345678.
+
+        Args:
+            tracking_number (str): Optional pre-generated code
+                (see bulk_generate_tracking) to assign instead.
+        """
+        if tracking_number is None:
+            tracking_number = _next_tracking_code()
+        self._tracking_number = tracking_number
 
         self._add_event(f"Tracking generated: {self._tracking_number}")
         return self._tracking_number
@@ -775,14 +1702,15 @@ class Shipment:
     def mark_delivered(self):
         self._delivered = True
         self._add_event("Shipment delivered")
+        self.flush_events() # Delivery completes the history in deferred mode too
 
     def is_delivered(self):
         """Return delivery status as boolean."""
         return self._delivered
 
     def history(self):
-        """Return all shipment events."""
-        return list(self._events)
+        """Return all shipment events as a read-only tuple of (datetime, text) pairs."""
+        return tuple((_ns_to_datetime(ns), text) for ns, text in self._events)
 
     def __repr__(self):
         return (
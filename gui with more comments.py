@@ -4,6 +4,58 @@ import backend  # Imports the logic file (backend.py) where your classes like Pr
 from datetime import datetime
 import pickle   # Used for saving and loading data to a file
 import os       # Used to check if a file exists on the computer
+from concurrent.futures import ThreadPoolExecutor # Runs slow work outside the GUI thread
+from contextlib import contextmanager # Lets a function be used in a 'with' block
+
+# One background worker for building reports. Tkinter widgets may only be touched
+# from the main thread, so the worker only builds the text; the window is made later.
+_executor = ThreadPoolExecutor(max_workers=1)
+
+# Save file format: these 4 bytes, then the pickled data. The tag lets a future
+# version recognise (and convert) files written in this format. Files that don't
+# start with it were saved by older versions as a plain pickle.
+_IO_BUFFER = 1 << 20 # Read/write the save file in 1 MiB chunks (fewer system calls)
+
+@contextmanager
+def _tree_bulk(tree):
+    """Detaches a Treeview's scrollbar callback while many rows are changed."""
+    # Every row change would otherwise make Tk call the scrollbar back to
+    # resize its slider; with the callback removed it is only updated once
+    command = tree.cget("yscrollcommand")
+    tree.configure(yscrollcommand="")
+    try:
+        yield # The body of the 'with' block runs here
+    finally:
+        tree.configure(yscrollcommand=command) # Scrollbar catches up once
+
+def _sync_tree(tree, rows, row_iids, row_values):
+    """
+    Makes a Treeview show rows (a list of (key, values) pairs) by diffing:
+    only new rows are inserted, changed rows updated and vanished rows deleted.
+    row_iids / row_values map each key to its row ID / last shown values.
+    Rows must keep their relative order between calls (e.g. a sliding window).
+    """
+    keys = {key for key, _ in rows}
+    with _tree_bulk(tree):
+        # First remove rows whose key is no longer in the data
+        # (e.g. after loading a save, or scrolled out of a window)
+        gone = [key for key in row_iids if key not in keys]
+        for key in gone:
+            tree.delete(row_iids.pop(key))
+            del row_values[key]
+
+        for index, (key, values) in enumerate(rows):
+            iid = row_iids.get(key)
+            if iid is None:
+                # New key: insert it at its position in the list and remember its ID.
+                # The surviving rows are already in the right order, so this keeps
+                # the whole table sorted (rows scrolled in at the top go to the top)
+                row_iids[key] = tree.insert("", index, values=values)
+            elif row_values[key] != values:
+                # Existing row whose data changed: edit it in place
+                tree.item(iid, values=values)
+            # (Unchanged rows cost no Tk call at all)
+            row_values[key] = values
 
 # =============================================================================
 # TAB 1: INVENTORY MANAGEMENT
@@ -13,6 +65,16 @@ class InventoryTab(ttk.Frame):
     This class represents the 'Inventory' tab in the application.
     It inherits from ttk.Frame, meaning it is a container for other widgets.
     """
+    # The standard form fields, as (label text, name of the attribute holding the Entry).
+    # create_widgets builds one Label + Entry pair per row of this table.
+    FIELDS = (
+        ("ID:", "entry_id"),
+        ("Name:", "entry_name"),
+        ("Price ($):", "entry_price"),
+        ("Volume (m3):", "entry_vol"),
+        ("Weight (kg):", "entry_weight"),
+    )
+
     def __init__(self, parent, inventory_manager, logger):
         # Initialize the parent class (ttk.Frame)
         super().__init__(parent)
@@ -42,31 +104,13 @@ class InventoryTab(ttk.Frame):
         ttk.Radiobutton(left_frame, text="Durable", variable=self.prod_type, value="Durable", command=self.toggle_inputs).pack(anchor="w")
         
         # --- Standard Fields (ID, Name, Price, etc.) ---
-        # We create a Label (text) and an Entry (input box) for each field
-        lbl = ttk.Label(left_frame, text="ID:")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_id = ttk.Entry(left_frame)
-        self.entry_id.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Name:")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_name = ttk.Entry(left_frame)
-        self.entry_name.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Price ($):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_price = ttk.Entry(left_frame)
-        self.entry_price.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Volume (m3):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_vol = ttk.Entry(left_frame)
-        self.entry_vol.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Weight (kg):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_weight = ttk.Entry(left_frame)
-        self.entry_weight.pack(fill=tk.X)
+        # We create a Label (text) and an Entry (input box) for each field in FIELDS
+        for text, attr in self.FIELDS:
+            ttk.Label(left_frame, text=text).pack(anchor="w", pady=5)
+            entry = ttk.Entry(left_frame)
+            entry.pack(fill=tk.X)
+            # Store it as self.entry_id, self.entry_name, ... so add_product can read it
+            setattr(self, attr, entry)
 
         # --- Dynamic Fields Frame ---
         # This frame holds inputs that change based on Product Type (e.g., Expiry Date vs Material)
@@ -235,7 +279,25 @@ class InventoryTab(ttk.Frame):
 
     def show_report(self):
         """Generates text report and shows it in a new window."""
-        report = self.inv_mgr.generate_report()
+        # Build the report in the background so the window doesn't freeze.
+        # The worker gets a copy of the product list taken here on the Tk thread,
+        # because adding/removing products while it loops over the live dict would crash it
+        products = list(self.inv_mgr.iter_products())
+        future = _executor.submit(self.inv_mgr.generate_report, products)
+        # Check back in 50 ms (after() schedules a call on the GUI thread)
+        self.after(50, self._show_report_when_ready, future)
+
+    def _show_report_when_ready(self, future):
+        """Waits (without blocking) for the report, then opens the window."""
+        if not future.done():
+            # Not finished yet: check again a bit later
+            self.after(50, self._show_report_when_ready, future)
+            return
+        try:
+            report = future.result() # The finished report text
+        except Exception as e: # Re-raised here if the worker failed
+            messagebox.showerror("Error", f"Failed to build the report: {e}")
+            return
         
         # Toplevel creates a new pop-up window
         top = tk.Toplevel(self)
@@ -250,34 +312,49 @@ class InventoryTab(ttk.Frame):
 
     def refresh_list(self):
         """Clears the table and re-reads data from backend."""
-        # Delete all current rows in the UI
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Delete all current rows in the UI with a single Tk call
+        # (get_children() returns every row ID, unpacked into one delete)
+        self.tree.delete(*self.tree.get_children())
         
-        # Loop through dictionary in backend
-        # Note: Accessing _inventory (private) directly for demo purposes
-        for p in self.inv_mgr._inventory.values():
-            info = ""
-            # Determine special info based on type
-            if isinstance(p, backend.PerishableProduct):
-                info = f"Exp: {p.expiry_date.date()} | {p.check_status()}"
-            else:
-                info = f"Mat: {p._material_type}"
-            
-            # Insert row into table
-            self.tree.insert("", tk.END, values=(p.product_id, p.name, p.product_type, p.base_price, info))
+        # Build every row's values first...
+        rows = []
+        # iter_products() is a live read-only view of the backend dictionary
+        for p in self.inv_mgr.iter_products():
+            # Each product type formats its own special info (expiry/status or material)
+            rows.append((p.product_id, p.name, p.product_type, p.base_price, p.get_display_info()))
+
+        # ...then insert them into the table in one tight loop
+        insert = self.tree.insert
+        with _tree_bulk(self.tree):
+            for values in rows:
+                insert("", tk.END, values=values)
 
 
 # =============================================================================
 # TAB 2: WAREHOUSE / STORAGE LOCATIONS
 # =============================================================================
 class WarehouseTab(ttk.Frame):
+    # Big warehouses would need thousands of table rows. From VIRTUAL_MIN locations
+    # on, only a "window" of VIEW_SIZE rows exists and scrolling slides that window
+    VIEW_SIZE = 100   # Most rows rendered at once for large warehouses
+    VIRTUAL_MIN = 500 # Below this many locations every row is rendered
+
     def __init__(self, parent, warehouse, inventory_manager, optimizer, logger):
         super().__init__(parent)
         self.warehouse = warehouse
         self.inv_mgr = inventory_manager
         self.optimizer = optimizer
         self.logger = logger
+        # Which tree row shows which location, and what it currently shows (see _sync_tree)
+        # Keyed by the location object itself: location IDs are not required to be unique
+        self._row_iids = {} # location -> tree row
+        self._row_values = {} # location -> values last shown
+        # The inventory manager and its version number when the dropdown was last filled.
+        # The backend bumps the version on every add/remove/price change.
+        self._combo_seen = None
+        self._combo_products_list = [] # Product objects in the same order as the dropdown entries
+        self._view_start = 0 # Index of the first rendered location (large warehouses only)
+        self._virtual = False # True while only a window of rows is rendered
         self.create_widgets()
 
     def create_widgets(self):
@@ -318,7 +395,7 @@ class WarehouseTab(ttk.Frame):
         ttk.Label(left_frame, text="Store Product:").pack(anchor="w")
         
         # Combobox: A dropdown menu to select a product
-        self.combo_products = ttk.Combobox(left_frame)
+        self.combo_products = ttk.Combobox(left_frame, state="readonly") # Pick from the list only, no typing
         self.combo_products.pack(fill=tk.X)
         
         ttk.Button(left_frame, text="Auto-Place Item", command=self.place_item).pack(fill=tk.X, pady=5)
@@ -335,14 +412,26 @@ class WarehouseTab(ttk.Frame):
         right_frame = ttk.LabelFrame(split, text="Storage Status", padding=10)
         split.add(right_frame, weight=3)
 
+        # Table + scrollbar share a frame so they sit side by side
+        table = ttk.Frame(right_frame)
+        table.pack(fill=tk.BOTH, expand=True)
         cols = ("id", "type", "cap", "load", "free")
-        self.tree = ttk.Treeview(right_frame, columns=cols, show="headings")
+        self.tree = ttk.Treeview(table, columns=cols, show="headings")
         self.tree.heading("id", text="ID")
         self.tree.heading("type", text="Type")
         self.tree.heading("cap", text="Capacity")
         self.tree.heading("load", text="Load")
         self.tree.heading("free", text="Free Space")
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        # The scrollbar is connected in _refresh_tree (it works differently in windowed mode)
+        self.loc_scroll = ttk.Scrollbar(table, orient=tk.VERTICAL)
+        self.loc_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Mouse wheel: <MouseWheel> on Windows/macOS, buttons 4/5 on Linux (X11)
+        self.tree.bind("<MouseWheel>", lambda e: self._on_wheel(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self._on_wheel(-1)) # X11 wheel up
+        self.tree.bind("<Button-5>", lambda e: self._on_wheel(1)) # X11 wheel down
+        # Resizing changes how many rows are visible, so the window and slider must follow
+        self.tree.bind("<Configure>", lambda e: self._virtual and self._refresh_tree())
 
         ttk.Button(right_frame, text="Refresh", command=self.refresh_all).pack(fill=tk.X)
         
@@ -364,18 +453,24 @@ class WarehouseTab(ttk.Frame):
         self.lbl_max = ttk.Label(self.loc_var_frame, text="Max Temp (C):")
         self.ent_max = ttk.Entry(self.loc_var_frame)
         self.fridge_widgets = [self.lbl_min, self.ent_min, self.lbl_max, self.ent_max]
+        # Widgets currently packed in loc_var_frame (empty until the first toggle)
+        self._currently_packed = []
 
     def toggle_loc_inputs(self):
         """Show inputs matching radio selection."""
-        for w in self.loc_var_frame.winfo_children():
-            w.pack_forget()
-        
         if self.loc_type.get() == "Shelf":
-            for w in self.shelf_widgets:
-                w.pack(anchor="w", fill=tk.X)
+            group = self.shelf_widgets
         else:
-            for w in self.fridge_widgets:
-                w.pack(anchor="w", fill=tk.X)
+            group = self.fridge_widgets
+        if group is self._currently_packed:
+            return
+
+        # Only touch the group that is actually on screen
+        for w in self._currently_packed:
+            w.pack_forget()
+        for w in group:
+            w.pack(anchor="w", fill=tk.X)
+        self._currently_packed = group
 
     def add_location(self):
         """Creates a location object (Shelf/Fridge) and adds to warehouse."""
@@ -405,9 +500,8 @@ class WarehouseTab(ttk.Frame):
         if not sel:
             return
         
-        # Extract ID (Format is "ID - Name")
-        pid = sel.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        # Look up the product object by its position in the dropdown
+        product = self._selected_product()
         if not product:
             return
 
@@ -430,8 +524,7 @@ class WarehouseTab(ttk.Frame):
         if not sel_prod:
             messagebox.showwarning("Select", "Select a product first.")
             return
-        pid = sel_prod.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        product = self._selected_product()
 
         # 2. Get Location (via selection in right tree)
         sel_loc = self.tree.selection()
@@ -466,8 +559,7 @@ class WarehouseTab(ttk.Frame):
         if not sel_prod:
             messagebox.showwarning("Select", "Select the product type you are removing (to calculate weight).")
             return
-        pid = sel_prod.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        product = self._selected_product()
 
         if loc and product:
             loc.remove_item(product)
@@ -477,17 +569,88 @@ class WarehouseTab(ttk.Frame):
 
     def refresh_all(self):
         """Reloads the list of locations and updates the product dropdown."""
-        # Update tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        for loc in self.warehouse.locations:
+        self._refresh_tree()
+
+        # Update product dropdown values, but only if the inventory changed
+        # (or was replaced by Load Data) since the dropdown was last filled
+        seen = (self.inv_mgr, self.inv_mgr.version)
+        if seen != self._combo_seen:
+            self._combo_products_list = list(self.inv_mgr.iter_products())
+            products = [f"{p.product_id} - {p.name}" for p in self._combo_products_list]
+            self.combo_products['values'] = products
+            self._combo_seen = seen
+
+    def _visible_rows(self):
+        """Returns how many of the rendered rows fit in the table at its current height."""
+        rendered = len(self.tree.get_children())
+        if not rendered:
+            return self.VIEW_SIZE
+        # yview() gives the visible part of the rendered rows as fractions
+        first, last = self.tree.yview()
+        return max(1, min(rendered, round((last - first) * rendered)))
+
+    def _refresh_tree(self):
+        """Updates the locations table (all rows, or the current window of a large warehouse)."""
+        locations = self.warehouse.locations
+        self._virtual = len(locations) >= self.VIRTUAL_MIN
+        if self._virtual:
+            # Keep the window inside the list. The limit uses the visible rows, not
+            # VIEW_SIZE, so the last locations can still be scrolled into view
+            visible = self._visible_rows()
+            self._view_start = max(0, min(self._view_start, len(locations) - visible))
+            window = locations[self._view_start:self._view_start + self.VIEW_SIZE]
+            # The scrollbar now moves the window instead of scrolling the table
+            self.tree.configure(yscrollcommand="")
+            self.loc_scroll.configure(command=self._on_scroll)
+            # Slider position/size as fractions of the full list (sized to what is visible)
+            self.loc_scroll.set(self._view_start / len(locations), (self._view_start + visible) / len(locations))
+        else:
+            # Small warehouse: render every row and let Tk scroll the table itself
+            self._view_start = 0
+            window = locations
+            self.tree.configure(yscrollcommand=self.loc_scroll.set)
+            self.loc_scroll.configure(command=self.tree.yview)
+
+        # Build (key, values) for every location in view, then let
+        # _sync_tree touch only the rows that actually changed
+        rows = []
+        for loc in window:
             ltype = "Shelf" if isinstance(loc, backend.Shelf) else "Fridge"
-            self.tree.insert("", tk.END, values=(loc.location_id, ltype, loc.capacity, loc.current_load, loc.get_remaining_capacity()))
-
-        # Update product dropdown values
-        products = [f"{p.product_id} - {p.name}" for p in self.inv_mgr._inventory.values()]
-        self.combo_products['values'] = products
+            rows.append((loc, (loc.location_id, ltype, loc.capacity, loc.current_load, loc.get_remaining_capacity())))
+        _sync_tree(self.tree, rows, self._row_iids, self._row_values)
+        if self._virtual:
+            self.tree.yview_moveto(0) # The window start is the first visible row
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Scrollbar callback in windowed mode: moves the window over all locations."""
+        if action == "moveto":
+            # Slider dragged: amount is a fraction (0.0 - 1.0) of the list
+            self._view_start = int(float(amount) * len(self.warehouse.locations))
+        else: # "scroll" by units (rows) or pages (arrow clicks / trough clicks)
+            self._view_start += int(amount) * (self._visible_rows() if unit == "pages" else 1)
+        self._refresh_tree()
+
+    def _on_wheel(self, rows):
+        """Mouse wheel handler; only takes over scrolling in windowed mode."""
+        if not self._virtual:
+            return None # Let the Treeview scroll normally
+        self._on_scroll("scroll", rows * 3, "units")
+        return "break" # Stop Tk's own scrolling of the table
+
+    def _selected_product(self):
+        """Returns the product chosen in the dropdown, or None."""
+        # current() is the index of the chosen entry (-1 if nothing is chosen),
+        # so no need to parse the "ID - Name" text
+        idx = self.combo_products.current()
+        if idx < 0:
+            return None
+        product = self._combo_products_list[idx]
+        # The list is only rebuilt on refresh, so the product may have been
+        # removed (or replaced under the same ID) since then
+        if self.inv_mgr.get_product(product.product_id) is not product:
+            messagebox.showwarning("Select", "That product is no longer in the inventory. Press Refresh.")
+            return None
+        return product
 
 
 # =============================================================================
@@ -500,6 +663,13 @@ class OrderTab(ttk.Frame):
         self.wh = warehouse
         self.logger = logger
         self.orders = [] # Local list to track active orders in memory
+        # Same orders indexed by ID, so lookups don't scan the whole list
+        self._orders_by_id = {} # order_id -> CustomerOrder
+        # Which tree row shows which order, and what it currently shows (see _sync_tree)
+        self._row_iids = {} # order object -> tree row (like WarehouseTab, not keyed by ID)
+        self._row_values = {} # order object -> values last shown
+        # Inventory manager + version the product Listbox was last built from
+        self._items_seen = None
         self.create_widgets()
 
     def create_widgets(self):
@@ -552,18 +722,28 @@ class OrderTab(ttk.Frame):
 
     def refresh_items(self):
         """Fills the ListBox with available products."""
+        # Nothing to do if the inventory hasn't changed since the last fill
+        # (skipping the rebuild also keeps whatever the user has selected)
+        seen = (self.inv_mgr, self.inv_mgr.version)
+        if seen == self._items_seen:
+            return
+        # Helper list to map Listbox index to Product Object
+        self.product_map = list(self.inv_mgr.iter_products())
         self.lst_products.delete(0, tk.END)
-        self.product_map = [] # Helper list to map Listbox index to Product Object
-        for p in self.inv_mgr._inventory.values():
-            self.lst_products.insert(tk.END, f"{p.name} (${p.base_price})")
-            self.product_map.append(p)
+        # One insert call adds every line
+        self.lst_products.insert(tk.END, *[f"{p.name} (${p.base_price})" for p in self.product_map])
+        self._items_seen = seen
 
     def refresh_orders(self):
         """Updates the Order Treeview."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for o in self.orders:
-            self.tree.insert("", tk.END, values=(o.order_id, o._customer_name, o.status, len(o.items)))
+        # Only orders that are new or changed status cost a Tk call
+        rows = [(o, (o.order_id, o._customer_name, o.status, len(o.items))) for o in self.orders]
+        _sync_tree(self.tree, rows, self._row_iids, self._row_values)
+
+    def set_orders(self, orders):
+        """Replaces the order list (e.g. after loading a save) and rebuilds the ID index."""
+        self.orders = orders
+        self._orders_by_id = {o.order_id: o for o in orders}
 
     def create_order(self):
         """Compiles selected items into a new Order object."""
@@ -582,15 +762,15 @@ class OrderTab(ttk.Frame):
             messagebox.showerror("Error", "ID and Customer required.")
             return
 
-        # Check existing ID
-        for o in self.orders:
-            if o.order_id == oid:
-                messagebox.showerror("Error", "Order ID exists.")
-                return
+        # Check existing ID (a dictionary lookup, not a loop over all orders)
+        if oid in self._orders_by_id:
+            messagebox.showerror("Error", "Order ID exists.")
+            return
 
-        # Create Order Object
+        # Create Order Object, then record it in both the list and the index
         new_order = backend.CustomerOrder(oid, cust, items, self.logger)
         self.orders.append(new_order)
+        self._orders_by_id[oid] = new_order
         self.refresh_orders()
         
         # Reset ID field
@@ -604,10 +784,8 @@ class OrderTab(ttk.Frame):
         if not sel: return None
         item = self.tree.item(sel[0])
         oid = item['values'][0]
-        for o in self.orders:
-            if o.order_id == oid:
-                return o
-        return None
+        # Find the order object with this ID (None if it doesn't exist)
+        return self._orders_by_id.get(oid)
 
     def do_pick(self):
         """Updates order status to Picked."""
@@ -653,14 +831,25 @@ class LogsTab(ttk.Frame):
         self.txt = tk.Text(self, state='disabled') 
         self.txt.pack(fill=tk.BOTH, expand=True)
         ttk.Button(self, text="Refresh Logs", command=self.refresh).pack(fill=tk.X)
-        self.refresh()
+        # How far into the log we have displayed (a position from logger.export_since)
+        self._position = 0
+        # No refresh here: MainApp fills the text when the tab is first opened
 
     def refresh(self):
+        # Ask the logger only for records we haven't shown yet, instead of
+        # deleting and re-inserting the whole log every time
+        text, position = self.logger.export_since(self._position)
+        if not text:
+            return # Nothing new
         # Enable editing momentarily to insert text
         self.txt.config(state='normal')
-        self.txt.delete(1.0, tk.END) # Clear all
-        self.txt.insert(tk.END, self.logger.export_as_text()) # Insert logs
+        # "end-1c" is the last character; if it is at "1.0" the widget is empty
+        if self.txt.compare("end-1c", "!=", "1.0"):
+            text = "\n" + text # Put the new records on their own line
+        self.txt.insert(tk.END, text) # Append new logs at the bottom
         self.txt.config(state='disabled') # Disable editing again
+        self.txt.see(tk.END) # Scroll to the newest record
+        self._position = position
 
 
 # =============================================================================
@@ -696,19 +885,37 @@ class MainApp(tk.Tk):
         notebook = ttk.Notebook(self)
         notebook.pack(fill=tk.BOTH, expand=True)
 
-        # Create instances of our Tab classes and add them to notebook
+        self.notebook = notebook
+
+        # The Inventory tab is the one visible at startup, so it is created right away
         self.tab_inv = InventoryTab(notebook, self.inv_mgr, self.logger)
         notebook.add(self.tab_inv, text="Inventory")
 
-        self.tab_wh = WarehouseTab(notebook, self.warehouse, self.inv_mgr, self.optimizer, self.logger)
-        notebook.add(self.tab_wh, text="Warehouse")
-
-        self.tab_ord = OrderTab(notebook, self.inv_mgr, self.warehouse, self.logger)
-        notebook.add(self.tab_ord, text="Orders")
+        # Which refresh method belongs to which tab. notebook.select() returns the
+        # selected tab's widget path, which is the same as str(tab)
+        self._tab_refresh = {str(self.tab_inv): self.tab_inv.refresh_list}
+        self._refresh_job = None # Pending after() call, if a refresh is scheduled
+
+        # The other tabs are only created the first time the user opens them, which
+        # makes the window appear faster. Until then each one is an empty frame
+        # with a "Loading..." label, and the tab attribute is None.
+        self.tab_wh = None
+        self.tab_ord = None
+        self.tab_logs = None
+        self._pending_orders = [] # Orders loaded from a file before the Orders tab exists
+        # Placeholder widget path -> (attribute to set, function that builds the tab,
+        # name of the tab's refresh method)
+        self._tab_builders = {}
+        for attr, title, builder, refresh in (
+            ("tab_wh", "Warehouse", self._build_warehouse_tab, "refresh_all"),
+            ("tab_ord", "Orders", self._build_order_tab, "refresh_items"),
+            ("tab_logs", "System Logs", lambda parent: LogsTab(parent, self.logger), "refresh"),
+        ):
+            placeholder = ttk.Frame(notebook)
+            ttk.Label(placeholder, text="Loading...").pack(pady=20)
+            notebook.add(placeholder, text=title)
+            self._tab_builders[str(placeholder)] = (attr, builder, refresh)
 
-        self.tab_logs = LogsTab(notebook, self.logger)
-        notebook.add(self.tab_logs, text="System Logs")
-        
         # Add event listener to refresh tabs when clicked
         notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
@@ -725,10 +932,45 @@ class MainApp(tk.Tk):
 
     def on_tab_change(self, event):
         """Refreshes the active tab so data stays in sync."""
-        self.tab_inv.refresh_list()
-        self.tab_wh.refresh_all()
-        self.tab_ord.refresh_items()
-        self.tab_logs.refresh()
+        # Clicking through several tabs quickly would refresh each one on the way.
+        # Instead, wait 50 ms and cancel the previous wait on every new switch,
+        # so only the tab the user stops on gets refreshed.
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(50, self._refresh_current_tab)
+
+    def _refresh_current_tab(self):
+        """Runs the refresh method of the currently visible tab only."""
+        self._refresh_job = None
+        path = self.notebook.select()
+        # First visit to this tab: create it now
+        if path in self._tab_builders:
+            self._build_tab(path)
+        refresh = self._tab_refresh.get(path)
+        if refresh:
+            refresh()
+
+    def _build_tab(self, path):
+        """Creates the real tab inside its placeholder frame, replacing the "Loading..." label."""
+        attr, builder, refresh = self._tab_builders.pop(path) # Only ever built once
+        placeholder = self.nametowidget(path) # Widget path -> widget object
+        for child in placeholder.winfo_children():
+            child.destroy()
+        tab = builder(placeholder)
+        tab.pack(fill=tk.BOTH, expand=True)
+        setattr(self, attr, tab) # e.g. self.tab_wh = tab
+        self._tab_refresh[path] = getattr(tab, refresh) # e.g. tab.refresh_all
+
+    def _build_warehouse_tab(self, parent):
+        """Builder for the Warehouse tab (uses whatever data is current at that moment)."""
+        return WarehouseTab(parent, self.warehouse, self.inv_mgr, self.optimizer, self.logger)
+
+    def _build_order_tab(self, parent):
+        """Builder for the Orders tab; hands over any orders loaded before it existed."""
+        tab = OrderTab(parent, self.inv_mgr, self.warehouse, self.logger)
+        tab.set_orders(self._pending_orders)
+        tab.refresh_orders()
+        return tab
 
     def seed_data(self):
         """Creates some dummy data so the app isn't empty on start."""
@@ -743,11 +985,24 @@ class MainApp(tk.Tk):
         data = {
             "inventory": self.inv_mgr,
             "warehouse": self.warehouse,
-            "orders": self.tab_ord.orders,
+            # If the Orders tab was never opened, its orders are still waiting here
+            "orders": self.tab_ord.orders if self.tab_ord is not None else self._pending_orders,
         }
+        # Pickling a big inventory and writing it to disk can take a while, so it
+        # runs on the background worker; the window stays responsive meanwhile
+        future = _executor.submit(self._write_data_file, data)
+        self._wait_for(future, self._save_finished, "Saving...")
+
+    def _write_data_file(self, data):
+        """Runs on the worker thread: pickles data into the save file."""
+        with open(self.data_file, "wb", buffering=_IO_BUFFER) as f:
+            # The newest pickle protocol is faster and produces smaller files
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _save_finished(self, future):
+        """Runs on the Tk thread once the save is done; reports success or the error."""
         try:
-            with open(self.data_file, "wb") as f:
-                pickle.dump(data, f)
+            future.result() # Re-raises any exception from the worker
             messagebox.showinfo("Save", f"Data saved to {self.data_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
@@ -758,9 +1013,20 @@ class MainApp(tk.Tk):
             messagebox.showwarning("Load", "No saved data file found.")
             return
         
+        # Read and unpickle the file on the background worker
+        future = _executor.submit(self._read_data_file)
+        self._wait_for(future, self._load_finished, "Loading...")
+
+    def _read_data_file(self):
+        """Runs on the worker thread: unpickles and returns the saved data."""
+        with open(self.data_file, "rb", buffering=_IO_BUFFER) as f:
+            return pickle.load(f)
+
+    def _load_finished(self, future):
+        """Runs on the Tk thread once loading is done; swaps in the loaded objects."""
+        # Tkinter is not thread-safe, so all the widget updates happen here
         try:
-            with open(self.data_file, "rb") as f:
-                data = pickle.load(f)
+            data = future.result() # Re-raises any exception from the worker
             
             # Restore state variables
             self.inv_mgr = data["inventory"]
@@ -771,25 +1037,61 @@ class MainApp(tk.Tk):
             self.optimizer.inventory_manager = self.inv_mgr
             self.optimizer.warehouse = self.warehouse
             
+            # (Tabs that haven't been built yet are skipped: their builders
+            # read the new objects from self when they are created)
             self.tab_inv.inv_mgr = self.inv_mgr
-            self.tab_wh.inv_mgr = self.inv_mgr
-            self.tab_wh.warehouse = self.warehouse
-            self.tab_wh.optimizer = self.optimizer
-            self.tab_ord.inv_mgr = self.inv_mgr
-            self.tab_ord.wh = self.warehouse
-            self.tab_ord.orders = data["orders"]
+            if self.tab_wh is not None:
+                self.tab_wh.inv_mgr = self.inv_mgr
+                self.tab_wh.warehouse = self.warehouse
+                self.tab_wh.optimizer = self.optimizer
+            if self.tab_ord is not None:
+                self.tab_ord.inv_mgr = self.inv_mgr
+                self.tab_ord.wh = self.warehouse
+                self.tab_ord.set_orders(data["orders"]) # Also rebuilds the order ID index
+            else:
+                self._pending_orders = data["orders"] # Handed over when the tab is built
             
             messagebox.showinfo("Load", "Data loaded successfully.")
             
-            # Refresh all UIs
+            # Refresh all UIs that exist
             self.tab_inv.refresh_list()
-            self.tab_wh.refresh_all()
-            self.tab_ord.refresh_orders()
-            self.tab_ord.refresh_items()
+            if self.tab_wh is not None:
+                self.tab_wh.refresh_all()
+            if self.tab_ord is not None:
+                self.tab_ord.refresh_orders()
+                self.tab_ord.refresh_items()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load: {e}")
 
+    def _wait_for(self, future, callback, text):
+        """
+        Shows a small "Saving..."/"Loading..." window until a background job
+        finishes, then calls callback(future) on the Tk thread.
+        """
+        dialog = tk.Toplevel(self)
+        dialog.title(text)
+        dialog.transient(self) # Keep it on top of the main window
+        ttk.Label(dialog, text=text, padding=20).pack()
+        # Ignore the close button: _poll_future destroys the dialog when the job
+        # is done, and closing it early would let the user edit mid-save
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+        # grab_set makes the dialog modal: the user can't change the data
+        # while the worker thread is still pickling it. On X11 the grab fails
+        # ("grab failed") unless the window is already on screen, so wait for that first
+        dialog.wait_visibility()
+        dialog.grab_set()
+        self.after(50, self._poll_future, future, callback, dialog)
+
+    def _poll_future(self, future, callback, dialog):
+        """Checks every 50 ms whether the job is done (same idea as _show_report_when_ready)."""
+        if not future.done():
+            self.after(50, self._poll_future, future, callback, dialog)
+            return
+        dialog.grab_release()
+        dialog.destroy()
+        callback(future)
+
 # Check if this file is being run directly (not imported)
 if __name__ == "__main__":
     app = MainApp()
@@ -4,8 +4,58 @@ import backend
 from datetime import datetime
 import pickle
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# Worker thread for report generation, so the Tk loop never blocks on it
+_executor = ThreadPoolExecutor(max_workers=1)
+
+# Save files start with this tag, then a pickle; files without it are older plain pickles
+_IO_BUFFER = 1 << 20 # 1 MiB file buffer for saving/loading
+
+@contextmanager
+def _tree_bulk(tree):
+    """Detaches a Treeview's scrollbar callback while many rows are changed."""
+    command = tree.cget("yscrollcommand")
+    tree.configure(yscrollcommand="")
+    try:
+        yield
+    finally:
+        tree.configure(yscrollcommand=command) # Scrollbar catches up once
+
+def _sync_tree(tree, rows, row_iids, row_values):
+    """
+    Makes a Treeview show rows (a list of (key, values) pairs) by diffing:
+    only new rows are inserted, changed rows updated and vanished rows deleted.
+    row_iids / row_values map each key to its row ID / last shown values.
+    Rows must keep their relative order between calls (e.g. a sliding window).
+    """
+    keys = {key for key, _ in rows}
+    with _tree_bulk(tree):
+        gone = [key for key in row_iids if key not in keys]
+        for key in gone:
+            tree.delete(row_iids.pop(key))
+            del row_values[key]
+
+        # Surviving rows are already in order, so inserting at the row's index keeps it sorted
+        for index, (key, values) in enumerate(rows):
+            iid = row_iids.get(key)
+            if iid is None:
+                row_iids[key] = tree.insert("", index, values=values)
+            elif row_values[key] != values:
+                tree.item(iid, values=values)
+            row_values[key] = values
 
 class InventoryTab(ttk.Frame):
+    # Common form fields: (label text, entry attribute name)
+    FIELDS = (
+        ("ID:", "entry_id"),
+        ("Name:", "entry_name"),
+        ("Price ($):", "entry_price"),
+        ("Volume (m3):", "entry_vol"),
+        ("Weight (kg):", "entry_weight"),
+    )
+
     def __init__(self, parent, inventory_manager, logger):
         super().__init__(parent)
         self.inv_mgr = inventory_manager
@@ -27,30 +77,11 @@ class InventoryTab(ttk.Frame):
         ttk.Radiobutton(left_frame, text="Durable", variable=self.prod_type, value="Durable", command=self.toggle_inputs).pack(anchor="w")
         
         # Common Fields
-        lbl = ttk.Label(left_frame, text="ID:")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_id = ttk.Entry(left_frame)
-        self.entry_id.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Name:")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_name = ttk.Entry(left_frame)
-        self.entry_name.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Price ($):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_price = ttk.Entry(left_frame)
-        self.entry_price.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Volume (m3):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_vol = ttk.Entry(left_frame)
-        self.entry_vol.pack(fill=tk.X)
-
-        lbl = ttk.Label(left_frame, text="Weight (kg):")
-        lbl.pack(anchor="w", pady=5)
-        self.entry_weight = ttk.Entry(left_frame)
-        self.entry_weight.pack(fill=tk.X)
+        for text, attr in self.FIELDS:
+            ttk.Label(left_frame, text=text).pack(anchor="w", pady=5)
+            entry = ttk.Entry(left_frame)
+            entry.pack(fill=tk.X)
+            setattr(self, attr, entry)
 
         # Variable Fields Frame
         self.var_frame = ttk.Frame(left_frame)
@@ -189,7 +220,20 @@ class InventoryTab(ttk.Frame):
                 messagebox.showerror("Error", "Failed to update price (cannot be negative).")
 
     def show_report(self):
-        report = self.inv_mgr.generate_report()
+        # Snapshot on the Tk thread: the worker must not iterate the live dict while edits go on
+        products = list(self.inv_mgr.iter_products())
+        future = _executor.submit(self.inv_mgr.generate_report, products)
+        self.after(50, self._show_report_when_ready, future)
+
+    def _show_report_when_ready(self, future):
+        if not future.done():
+            self.after(50, self._show_report_when_ready, future)
+            return
+        try:
+            report = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build the report: {e}")
+            return
         # Show in a new window
         top = tk.Toplevel(self)
         top.title("Inventory Report")
@@ -200,27 +244,37 @@ class InventoryTab(ttk.Frame):
         txt.config(state='disabled')
 
     def refresh_list(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # One Tk call clears every row
+        self.tree.delete(*self.tree.get_children())
         
-        # Access private inventory dict for display (demo purposes)
-        for p in self.inv_mgr._inventory.values():
-            info = ""
-            if isinstance(p, backend.PerishableProduct):
-                info = f"Exp: {p.expiry_date.date()} | {p.check_status()}"
-            else:
-                info = f"Mat: {p._material_type}"
-            
-            self.tree.insert("", tk.END, values=(p.product_id, p.name, p.product_type, p.base_price, info))
+        # Build all rows first, then insert them in one pass
+        rows = []
+        for p in self.inv_mgr.iter_products():
+            rows.append((p.product_id, p.name, p.product_type, p.base_price, p.get_display_info()))
+
+        insert = self.tree.insert
+        with _tree_bulk(self.tree):
+            for values in rows:
+                insert("", tk.END, values=values)
 
 
 class WarehouseTab(ttk.Frame):
+    VIEW_SIZE = 100   # Most rows rendered at once for large warehouses
+    VIRTUAL_MIN = 500 # Below this many locations every row is rendered
+
     def __init__(self, parent, warehouse, inventory_manager, optimizer, logger):
         super().__init__(parent)
         self.warehouse = warehouse
         self.inv_mgr = inventory_manager
         self.optimizer = optimizer
         self.logger = logger
+        # Keyed by the location object itself: location IDs are not required to be unique
+        self._row_iids = {} # location -> tree row
+        self._row_values = {} # location -> values last shown
+        self._combo_seen = None # (inventory manager, version) the dropdown was built from
+        self._combo_products_list = [] # Products in dropdown order
+        self._view_start = 0 # Index of the first rendered location (large warehouses only)
+        self._virtual = False
         self.create_widgets()
 
     def create_widgets(self):
@@ -253,7 +307,7 @@ class WarehouseTab(ttk.Frame):
         ttk.Separator(left_frame, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=15)
         
         ttk.Label(left_frame, text="Store Product:").pack(anchor="w")
-        self.combo_products = ttk.Combobox(left_frame)
+        self.combo_products = ttk.Combobox(left_frame, state="readonly")
         self.combo_products.pack(fill=tk.X)
         ttk.Button(left_frame, text="Auto-Place Item", command=self.place_item).pack(fill=tk.X, pady=5)
         ttk.Button(left_frame, text="Check Suitability", command=self.check_suitability).pack(fill=tk.X, pady=5)
@@ -268,14 +322,22 @@ class WarehouseTab(ttk.Frame):
         right_frame = ttk.LabelFrame(split, text="Storage Status", padding=10)
         split.add(right_frame, weight=3)
 
+        table = ttk.Frame(right_frame)
+        table.pack(fill=tk.BOTH, expand=True)
         cols = ("id", "type", "cap", "load", "free")
-        self.tree = ttk.Treeview(right_frame, columns=cols, show="headings")
+        self.tree = ttk.Treeview(table, columns=cols, show="headings")
         self.tree.heading("id", text="ID")
         self.tree.heading("type", text="Type")
         self.tree.heading("cap", text="Capacity")
         self.tree.heading("load", text="Load")
         self.tree.heading("free", text="Free Space")
-        self.tree.pack(fill=tk.BOTH, expand=True)
+        self.loc_scroll = ttk.Scrollbar(table, orient=tk.VERTICAL)
+        self.loc_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind("<MouseWheel>", lambda e: self._on_wheel(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self._on_wheel(-1)) # X11 wheel up
+        self.tree.bind("<Button-5>", lambda e: self._on_wheel(1)) # X11 wheel down
+        self.tree.bind("<Configure>", lambda e: self._virtual and self._refresh_tree()) # Visible row count changed
 
         ttk.Button(right_frame, text="Refresh", command=self.refresh_all).pack(fill=tk.X)
         
@@ -295,17 +357,21 @@ class WarehouseTab(ttk.Frame):
         self.lbl_max = ttk.Label(self.loc_var_frame, text="Max Temp (C):")
         self.ent_max = ttk.Entry(self.loc_var_frame)
         self.fridge_widgets = [self.lbl_min, self.ent_min, self.lbl_max, self.ent_max]
+        self._currently_packed = []
 
     def toggle_loc_inputs(self):
-        for w in self.loc_var_frame.winfo_children():
-            w.pack_forget()
-        
         if self.loc_type.get() == "Shelf":
-            for w in self.shelf_widgets:
-                w.pack(anchor="w", fill=tk.X)
+            group = self.shelf_widgets
         else:
-            for w in self.fridge_widgets:
-                w.pack(anchor="w", fill=tk.X)
+            group = self.fridge_widgets
+        if group is self._currently_packed:
+            return
+
+        for w in self._currently_packed:
+            w.pack_forget()
+        for w in group:
+            w.pack(anchor="w", fill=tk.X)
+        self._currently_packed = group
 
     def add_location(self):
         try:
@@ -332,8 +398,7 @@ class WarehouseTab(ttk.Frame):
         if not sel:
             return
         
-        pid = sel.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        product = self._selected_product()
         if not product:
             return
 
@@ -354,8 +419,7 @@ class WarehouseTab(ttk.Frame):
         if not sel_prod:
             messagebox.showwarning("Select", "Select a product first.")
             return
-        pid = sel_prod.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        product = self._selected_product()
 
         # 2. Get Location (via selection in right tree)
         sel_loc = self.tree.selection()
@@ -389,8 +453,7 @@ class WarehouseTab(ttk.Frame):
         if not sel_prod:
             messagebox.showwarning("Select", "Select the product type you are removing (to calculate weight).")
             return
-        pid = sel_prod.split(" - ")[0]
-        product = self.inv_mgr.get_product(pid)
+        product = self._selected_product()
 
         if loc and product:
             loc.remove_item(product)
@@ -399,17 +462,78 @@ class WarehouseTab(ttk.Frame):
             messagebox.showinfo("Removed", f"Removed weight of {product.name} from {loc.location_id}")
 
     def refresh_all(self):
-        # Update tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        for loc in self.warehouse.locations:
+        self._refresh_tree()
+
+        # Update combo (only when the inventory changed since the last build)
+        seen = (self.inv_mgr, self.inv_mgr.version)
+        if seen != self._combo_seen:
+            self._combo_products_list = list(self.inv_mgr.iter_products())
+            products = [f"{p.product_id} - {p.name}" for p in self._combo_products_list]
+            self.combo_products['values'] = products
+            self._combo_seen = seen
+
+    def _visible_rows(self):
+        # How many of the rendered rows fit in the tree at its current height
+        rendered = len(self.tree.get_children())
+        if not rendered:
+            return self.VIEW_SIZE
+        first, last = self.tree.yview()
+        return max(1, min(rendered, round((last - first) * rendered)))
+
+    def _refresh_tree(self):
+        # Large warehouses only render a window of up to VIEW_SIZE rows, moved by the
+        # scrollbar and mouse wheel; smaller ones render everything and scroll natively.
+        # The window scrolls by the rows that are actually visible, so the last
+        # locations can be reached and the scrollbar thumb matches the view.
+        locations = self.warehouse.locations
+        self._virtual = len(locations) >= self.VIRTUAL_MIN
+        if self._virtual:
+            visible = self._visible_rows()
+            self._view_start = max(0, min(self._view_start, len(locations) - visible))
+            window = locations[self._view_start:self._view_start + self.VIEW_SIZE]
+            self.tree.configure(yscrollcommand="")
+            self.loc_scroll.configure(command=self._on_scroll)
+            self.loc_scroll.set(self._view_start / len(locations), (self._view_start + visible) / len(locations))
+        else:
+            self._view_start = 0
+            window = locations
+            self.tree.configure(yscrollcommand=self.loc_scroll.set)
+            self.loc_scroll.configure(command=self.tree.yview)
+
+        # Update tree (only rows that changed, entered or left the window)
+        rows = []
+        for loc in window:
             ltype = "Shelf" if isinstance(loc, backend.Shelf) else "Fridge"
-            self.tree.insert("", tk.END, values=(loc.location_id, ltype, loc.capacity, loc.current_load, loc.get_remaining_capacity()))
-
-        # Update combo
-        products = [f"{p.product_id} - {p.name}" for p in self.inv_mgr._inventory.values()]
-        self.combo_products['values'] = products
+            rows.append((loc, (loc.location_id, ltype, loc.capacity, loc.current_load, loc.get_remaining_capacity())))
+        _sync_tree(self.tree, rows, self._row_iids, self._row_values)
+        if self._virtual:
+            self.tree.yview_moveto(0) # The window start is the first visible row
+
+    def _on_scroll(self, action, amount, unit=None):
+        # Scrollbar callback in windowed mode: moves the window over all locations
+        if action == "moveto":
+            self._view_start = int(float(amount) * len(self.warehouse.locations))
+        else: # "scroll" by units (rows) or pages
+            self._view_start += int(amount) * (self._visible_rows() if unit == "pages" else 1)
+        self._refresh_tree()
+
+    def _on_wheel(self, rows):
+        if not self._virtual:
+            return None # Normal Treeview scrolling
+        self._on_scroll("scroll", rows * 3, "units")
+        return "break"
+
+    def _selected_product(self):
+        # Product chosen in the dropdown, by position (None if nothing is chosen or the
+        # product left the inventory since the dropdown was built)
+        idx = self.combo_products.current()
+        if idx < 0:
+            return None
+        product = self._combo_products_list[idx]
+        if self.inv_mgr.get_product(product.product_id) is not product:
+            messagebox.showwarning("Select", "That product is no longer in the inventory. Press Refresh.")
+            return None
+        return product
 
 
 class OrderTab(ttk.Frame):
@@ -419,6 +543,10 @@ class OrderTab(ttk.Frame):
         self.wh = warehouse
         self.logger = logger
         self.orders = []
+        self._orders_by_id = {} # order_id -> CustomerOrder, kept in step with self.orders
+        self._row_iids = {} # order object -> tree row (like WarehouseTab, not keyed by ID)
+        self._row_values = {} # order object -> values last shown
+        self._items_seen = None # (inventory manager, version) the listbox was built from
         self.create_widgets()
 
     def create_widgets(self):
@@ -466,17 +594,23 @@ class OrderTab(ttk.Frame):
         self.refresh_items()
 
     def refresh_items(self):
+        # Rebuild only after the inventory changed (this also keeps the user's selection)
+        seen = (self.inv_mgr, self.inv_mgr.version)
+        if seen == self._items_seen:
+            return
+        self.product_map = list(self.inv_mgr.iter_products())
         self.lst_products.delete(0, tk.END)
-        self.product_map = []
-        for p in self.inv_mgr._inventory.values():
-            self.lst_products.insert(tk.END, f"{p.name} (${p.base_price})")
-            self.product_map.append(p)
+        self.lst_products.insert(tk.END, *[f"{p.name} (${p.base_price})" for p in self.product_map])
+        self._items_seen = seen
 
     def refresh_orders(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for o in self.orders:
-            self.tree.insert("", tk.END, values=(o.order_id, o._customer_name, o.status, len(o.items)))
+        rows = [(o, (o.order_id, o._customer_name, o.status, len(o.items))) for o in self.orders]
+        _sync_tree(self.tree, rows, self._row_iids, self._row_values)
+
+    def set_orders(self, orders):
+        # Replaces the order list (e.g. after loading) and rebuilds the ID index
+        self.orders = orders
+        self._orders_by_id = {o.order_id: o for o in orders}
 
     def create_order(self):
         selections = self.lst_products.curselection()
@@ -493,13 +627,13 @@ class OrderTab(ttk.Frame):
             return
 
         # Check existing ID
-        for o in self.orders:
-            if o.order_id == oid:
-                messagebox.showerror("Error", "Order ID exists.")
-                return
+        if oid in self._orders_by_id:
+            messagebox.showerror("Error", "Order ID exists.")
+            return
 
         new_order = backend.CustomerOrder(oid, cust, items, self.logger)
         self.orders.append(new_order)
+        self._orders_by_id[oid] = new_order
         self.refresh_orders()
         self.ent_oid.delete(0, tk.END)
         self.ent_oid.insert(0, f"ORD-{backend.random.randint(100,999)}")
@@ -510,10 +644,7 @@ class OrderTab(ttk.Frame):
         if not sel: return None
         item = self.tree.item(sel[0])
         oid = item['values'][0]
-        for o in self.orders:
-            if o.order_id == oid:
-                return o
-        return None
+        return self._orders_by_id.get(oid)
 
     def do_pick(self):
         order = self._get_selected_order()
@@ -552,13 +683,21 @@ class LogsTab(ttk.Frame):
         self.txt = tk.Text(self, state='disabled')
         self.txt.pack(fill=tk.BOTH, expand=True)
         ttk.Button(self, text="Refresh Logs", command=self.refresh).pack(fill=tk.X)
-        self.refresh()
+        self._position = 0 # Logger position shown so far (see export_since)
+        # First filled by MainApp when the tab is opened
 
     def refresh(self):
+        # Append only the records logged since the last refresh
+        text, position = self.logger.export_since(self._position)
+        if not text:
+            return
         self.txt.config(state='normal')
-        self.txt.delete(1.0, tk.END)
-        self.txt.insert(tk.END, self.logger.export_as_text())
+        if self.txt.compare("end-1c", "!=", "1.0"): # Widget not empty: start a new line
+            text = "\n" + text
+        self.txt.insert(tk.END, text)
         self.txt.config(state='disabled')
+        self.txt.see(tk.END)
+        self._position = position
 
 
 class MainApp(tk.Tk):
@@ -586,19 +725,32 @@ class MainApp(tk.Tk):
         # Tabs
         notebook = ttk.Notebook(self)
         notebook.pack(fill=tk.BOTH, expand=True)
+        self.notebook = notebook
 
+        # The first tab is visible at startup, so it is built right away
         self.tab_inv = InventoryTab(notebook, self.inv_mgr, self.logger)
         notebook.add(self.tab_inv, text="Inventory")
 
-        self.tab_wh = WarehouseTab(notebook, self.warehouse, self.inv_mgr, self.optimizer, self.logger)
-        notebook.add(self.tab_wh, text="Warehouse")
-
-        self.tab_ord = OrderTab(notebook, self.inv_mgr, self.warehouse, self.logger)
-        notebook.add(self.tab_ord, text="Orders")
+        # Refresh method per tab, keyed by the tab's widget path (what notebook.select() returns)
+        self._tab_refresh = {str(self.tab_inv): self.tab_inv.refresh_list}
+        self._refresh_job = None
+
+        # The other tabs start as "Loading..." placeholders and are built on first visit
+        self.tab_wh = None
+        self.tab_ord = None
+        self.tab_logs = None
+        self._pending_orders = [] # Orders loaded before the Orders tab exists
+        self._tab_builders = {} # placeholder path -> (attribute, builder, refresh method name)
+        for attr, title, builder, refresh in (
+            ("tab_wh", "Warehouse", self._build_warehouse_tab, "refresh_all"),
+            ("tab_ord", "Orders", self._build_order_tab, "refresh_items"),
+            ("tab_logs", "System Logs", lambda parent: LogsTab(parent, self.logger), "refresh"),
+        ):
+            placeholder = ttk.Frame(notebook)
+            ttk.Label(placeholder, text="Loading...").pack(pady=20)
+            notebook.add(placeholder, text=title)
+            self._tab_builders[str(placeholder)] = (attr, builder, refresh)
 
-        self.tab_logs = LogsTab(notebook, self.logger)
-        notebook.add(self.tab_logs, text="System Logs")
-        
         notebook.bind("<<NotebookTabChanged>>", self.on_tab_change)
 
     def create_menu(self):
@@ -612,11 +764,39 @@ class MainApp(tk.Tk):
         self.config(menu=menubar)
 
     def on_tab_change(self, event):
-        # Refresh tabs when switched to
-        self.tab_inv.refresh_list()
-        self.tab_wh.refresh_all()
-        self.tab_ord.refresh_items()
-        self.tab_logs.refresh()
+        # Refresh only the tab switched to, once switching has paused for 50 ms
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(50, self._refresh_current_tab)
+
+    def _refresh_current_tab(self):
+        self._refresh_job = None
+        path = self.notebook.select()
+        if path in self._tab_builders:
+            self._build_tab(path)
+        refresh = self._tab_refresh.get(path)
+        if refresh:
+            refresh()
+
+    def _build_tab(self, path):
+        # Replaces a placeholder's "Loading..." label with the real tab
+        attr, builder, refresh = self._tab_builders.pop(path)
+        placeholder = self.nametowidget(path)
+        for child in placeholder.winfo_children():
+            child.destroy()
+        tab = builder(placeholder)
+        tab.pack(fill=tk.BOTH, expand=True)
+        setattr(self, attr, tab)
+        self._tab_refresh[path] = getattr(tab, refresh)
+
+    def _build_warehouse_tab(self, parent):
+        return WarehouseTab(parent, self.warehouse, self.inv_mgr, self.optimizer, self.logger)
+
+    def _build_order_tab(self, parent):
+        tab = OrderTab(parent, self.inv_mgr, self.warehouse, self.logger)
+        tab.set_orders(self._pending_orders)
+        tab.refresh_orders()
+        return tab
 
     def seed_data(self):
         # Sample Data
@@ -630,13 +810,21 @@ class MainApp(tk.Tk):
         data = {
             "inventory": self.inv_mgr,
             "warehouse": self.warehouse,
-            "orders": self.tab_ord.orders,
+            "orders": self.tab_ord.orders if self.tab_ord is not None else self._pending_orders,
             # We can't pickle tkinter objects, so we need to be careful.
             # Luckily backend objects are pure python.
         }
+        # Pickling and disk I/O run on the worker thread
+        future = _executor.submit(self._write_data_file, data)
+        self._wait_for(future, self._save_finished, "Saving...")
+
+    def _write_data_file(self, data):
+        with open(self.data_file, "wb", buffering=_IO_BUFFER) as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _save_finished(self, future):
         try:
-            with open(self.data_file, "wb") as f:
-                pickle.dump(data, f)
+            future.result()
             messagebox.showinfo("Save", f"Data saved to {self.data_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save: {e}")
@@ -646,9 +834,17 @@ class MainApp(tk.Tk):
             messagebox.showwarning("Load", "No saved data file found.")
             return
         
+        future = _executor.submit(self._read_data_file)
+        self._wait_for(future, self._load_finished, "Loading...")
+
+    def _read_data_file(self):
+        with open(self.data_file, "rb", buffering=_IO_BUFFER) as f:
+            return pickle.load(f)
+
+    def _load_finished(self, future):
+        # Back on the Tk thread: swap in the loaded objects and refresh the tabs
         try:
-            with open(self.data_file, "rb") as f:
-                data = pickle.load(f)
+            data = future.result()
             
             # Restore state
             self.inv_mgr = data["inventory"]
@@ -658,26 +854,53 @@ class MainApp(tk.Tk):
             self.optimizer.inventory_manager = self.inv_mgr
             self.optimizer.warehouse = self.warehouse
             
-            # Update Pointers in Tabs
+            # Update Pointers in Tabs (tabs not built yet pick up the new objects when built)
             self.tab_inv.inv_mgr = self.inv_mgr
-            self.tab_wh.inv_mgr = self.inv_mgr
-            self.tab_wh.warehouse = self.warehouse
-            self.tab_wh.optimizer = self.optimizer
-            self.tab_ord.inv_mgr = self.inv_mgr
-            self.tab_ord.wh = self.warehouse
-            self.tab_ord.orders = data["orders"]
+            if self.tab_wh is not None:
+                self.tab_wh.inv_mgr = self.inv_mgr
+                self.tab_wh.warehouse = self.warehouse
+                self.tab_wh.optimizer = self.optimizer
+            if self.tab_ord is not None:
+                self.tab_ord.inv_mgr = self.inv_mgr
+                self.tab_ord.wh = self.warehouse
+                self.tab_ord.set_orders(data["orders"])
+            else:
+                self._pending_orders = data["orders"]
             
             # Log update isn't persisted (it's new session), but that's fine for now.
             
             messagebox.showinfo("Load", "Data loaded successfully.")
             self.tab_inv.refresh_list()
-            self.tab_wh.refresh_all()
-            self.tab_ord.refresh_orders()
-            self.tab_ord.refresh_items()
+            if self.tab_wh is not None:
+                self.tab_wh.refresh_all()
+            if self.tab_ord is not None:
+                self.tab_ord.refresh_orders()
+                self.tab_ord.refresh_items()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load: {e}")
 
+    def _wait_for(self, future, callback, text):
+        # Shows a small modal window until the background job is done, then calls
+        # callback(future) on the Tk thread. The grab keeps the user from editing
+        # the data while it is being pickled.
+        dialog = tk.Toplevel(self)
+        dialog.title(text)
+        dialog.transient(self)
+        ttk.Label(dialog, text=text, padding=20).pack()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None) # Closes itself when the job ends
+        dialog.wait_visibility() # X11 refuses to grab a window that is not mapped yet
+        dialog.grab_set()
+        self.after(50, self._poll_future, future, callback, dialog)
+
+    def _poll_future(self, future, callback, dialog):
+        if not future.done():
+            self.after(50, self._poll_future, future, callback, dialog)
+            return
+        dialog.grab_release()
+        dialog.destroy()
+        callback(future)
+
 
 if __name__ == "__main__":
     app = MainApp()
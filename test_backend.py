@@ -0,0 +1,247 @@
+import os
+import pickle
+import random
+import time
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+import backend
+
+# Written by the original gui.py save_data (plain pickle.dump) with the
+# original backend.py, from before the classes had __slots__ and columnar state.
+# Besides the GUI's "inventory", "warehouse" and "orders" it holds "shipments".
+BASELINE_SAVE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "test_data", "warehouse_data_baseline.pkl")
+
+
+class ParseDateTests(unittest.TestCase):
+    """_parse_ymd must accept exactly what strptime("%Y-%m-%d") accepts."""
+
+    def test_zero_padded(self):
+        self.assertEqual(backend._parse_ymd("2025-01-05"), datetime(2025, 1, 5))
+
+    def test_single_digit_month_and_day(self):
+        self.assertEqual(backend._parse_ymd("2025-1-5"), datetime(2025, 1, 5))
+        self.assertEqual(backend._parse_ymd("2025-12-3"), datetime(2025, 12, 3))
+        product = backend.PerishableProduct("P1", "Milk", 2.0, 0.01, 1.0, "2025-3-9", 4)
+        self.assertEqual(product.expiry_date, datetime(2025, 3, 9))
+
+    def test_invalid_dates_raise(self):
+        for text in ("2025-02-30", "2025-13-01", "20250105", "2025/01/05", ""):
+            with self.assertRaises(ValueError):
+                backend._parse_ymd(text)
+        with self.assertRaises(ValueError):
+            backend.PerishableProduct("P1", "Milk", 2.0, 0.01, 1.0, "05-01-2025", 4)
+
+
+class BulkPlacementTests(unittest.TestCase):
+    """find_best_locations must plan what find_best_location + add_item would do."""
+
+    @staticmethod
+    def _build(fridges, shelves):
+        warehouse = backend.Warehouse("Test")
+        for i, (capacity, load) in enumerate(fridges):
+            fridge = backend.RefrigeratedUnit(f"F{i}", capacity, 0, 5)
+            fridge.current_load = load
+            warehouse.add_location(fridge)
+        for i, (capacity, load) in enumerate(shelves):
+            warehouse.add_location(backend.Shelf(f"S{i}", capacity, load, 2.0))
+        return backend.OptimizationEngine(backend.InventoryManager(), warehouse)
+
+    @staticmethod
+    def _place_one_by_one(engine, products):
+        plan = []
+        for product in products:
+            location = engine.find_best_location(product)
+            if location is not None:
+                location.add_item(product)
+            plan.append(location)
+        return plan
+
+    def _assert_same_plan(self, fridges, shelves, products):
+        bulk = self._build(fridges, shelves).find_best_locations(products)
+        sequential = self._place_one_by_one(self._build(fridges, shelves), products)
+        self.assertEqual([loc and loc.location_id for loc in bulk],
+                         [loc and loc.location_id for loc in sequential])
+
+    def test_exact_fit_after_rounding(self):
+        # 1.9 + 0.3 <= 2.2 holds, while 2.2 - 1.9 >= 0.3 does not
+        milk = backend.PerishableProduct("P1", "Milk", 1.0, 0.01, 0.3, "2030-01-01", 4)
+        plan = self._build([(2.2, 1.9), (10, 0)], []).find_best_locations([milk])
+        self.assertEqual(plan[0].location_id, "F0")
+
+    def test_matches_sequential_placement(self):
+        rng = random.Random(1234)
+        for batch in range(300):
+            fridges = [(rng.randint(1, 30) / 10, rng.randint(0, 10) / 10) for _ in range(3)]
+            shelves = [(rng.randint(1, 30) / 10, rng.randint(0, 10) / 10) for _ in range(3)]
+            products = []
+            for i in range(20):
+                weight = rng.randint(1, 10) / 10
+                if rng.random() < 0.5:
+                    products.append(backend.PerishableProduct(
+                        f"P{i}", "Item", 1.0, 0.01, weight, "2030-01-01", rng.randint(-2, 7)))
+                else:
+                    products.append(backend.DurableProduct(
+                        f"D{i}", "Item", 1.0, 0.01, weight, "Steel", False))
+            with self.subTest(batch=batch):
+                self._assert_same_plan(fridges, shelves, products)
+
+
+class _ListSink:
+    """Minimal sink: collects whatever the logger writes."""
+
+    def __init__(self):
+        self.lines = []
+
+    def writelines(self, lines):
+        self.lines.extend(lines)
+
+
+class LoggerSinkTests(unittest.TestCase):
+
+    def test_lone_record_is_written_without_more_traffic(self):
+        sink = _ListSink()
+        logger = backend.TransactionLogger(sink=sink)
+        logger.log_info("only record")
+        self.assertEqual(sink.lines, []) # Still buffered right after logging
+        deadline = time.monotonic() + 2.0
+        while not sink.lines and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(sink.lines), 1)
+        self.assertIn("only record", sink.lines[0])
+
+    def test_pickle_with_pending_timer(self):
+        logger = backend.TransactionLogger(sink=_ListSink())
+        logger.log_info("buffered")
+        copy = pickle.loads(pickle.dumps(logger))
+        self.assertEqual([r["message"] for r in copy.get_logs()], ["buffered"])
+
+    def test_snapshot_is_detached(self):
+        logger = backend.TransactionLogger(sink=_ListSink())
+        for i in range(5):
+            logger.log_info(f"record {i}")
+        snapshot = logger.snapshot(last=2)
+        logger.log_info("after the snapshot")
+        self.assertEqual([r["message"] for r in snapshot.get_logs()], ["record 3", "record 4"])
+        self.assertEqual(len(logger.get_logs()), 6)
+
+
+class DeferredShipmentTests(unittest.TestCase):
+
+    def _check_logged_times(self, logger):
+        shipment = backend.Shipment("SHP-1", "ORD-1", "FedEx", logger, flush_mode="deferred")
+        time.sleep(0.002)
+        shipment.generate_tracking()
+        time.sleep(0.002)
+        shipment.mark_delivered()
+        logged = [(r["time"], r["message"].split(": ", 1)[1]) for r in logger.get_logs()]
+        self.assertEqual(logged, list(shipment.history()))
+        times = [t for t, _ in logged]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(len(set(times)), 3)
+
+    def test_logged_times_match_history(self):
+        self._check_logged_times(backend.TransactionLogger())
+
+    def test_logged_times_match_history_with_sink(self):
+        self._check_logged_times(backend.TransactionLogger(sink=_ListSink()))
+
+    def test_logged_times_match_history_in_background(self):
+        self._check_logged_times(backend.TransactionLogger(background=True))
+
+
+class BaselineSaveTests(unittest.TestCase):
+    """Save files from before __slots__ must still load and behave like fresh objects."""
+
+    def setUp(self):
+        with open(BASELINE_SAVE, "rb") as f:
+            self.data = pickle.load(f)
+
+    def test_products(self):
+        inv = self.data["inventory"]
+        milk, fish = inv.get_product("P01"), inv.get_product("P02")
+        table, vase = inv.get_product("D01"), inv.get_product("D02")
+        self.assertIsInstance(milk, backend.PerishableProduct)
+        self.assertEqual(fish.expiry_date, datetime(2001, 1, 5))
+        self.assertEqual(milk.check_status(), "FRESH")
+        self.assertEqual(fish.check_status(), "EXPIRED")
+        self.assertEqual(milk.get_display_info(), "Exp: 2099-12-30 | FRESH")
+        self.assertEqual(table.get_display_info(), "Mat: Wood")
+        self.assertIn("Name: Vase", vase.get_product_info())
+        fresh = backend.DurableProduct("D02", "Vase", 30.0, 0.01, 1.5, "Glass", True)
+        self.assertEqual(vase.calculate_storage_cost(10), fresh.calculate_storage_cost(10))
+        fresh = backend.PerishableProduct("P02", "Fish", 12.0, 0.02, 2.0, "2001-01-05", -18)
+        self.assertEqual(fish.calculate_storage_cost(10), fresh.calculate_storage_cost(10))
+
+    def test_inventory_manager(self):
+        inv = self.data["inventory"]
+        self.assertEqual(inv.get_total_inventory_value(), 194.5)
+        self.assertEqual(inv._category_count, {"Perishable": 2, "Durable": 2})
+        self.assertEqual(inv.get_by_name("Oak Table").product_id, "D01")
+        self.assertEqual(inv.check_expiring_products(), ["WARNING: Fish is EXPIRED"])
+        rebuilt = backend.InventoryManager()
+        rebuilt.bulk_add(inv.iter_products())
+        self.assertEqual(inv.calculate_total_projected_storage_cost(30),
+                         rebuilt.calculate_total_projected_storage_cost(30))
+        self.assertTrue(inv.remove_product("P02"))
+        self.assertEqual(inv.get_total_inventory_value(), 182.5)
+        self.assertTrue(inv.add_product(backend.DurableProduct("D03", "Chair", 40.0, 0.2, 5.0, "Wood", False)))
+
+    def test_warehouse(self):
+        wh = self.data["warehouse"]
+        self.assertEqual(wh.list_locations(), ["Shelf-A", "Fridge-B", "Freezer-C"])
+        fridge = wh.find_location_by_id("Fridge-B")
+        self.assertEqual((fridge.current_load, fridge.items_count), (1.1, 1))
+        self.assertIsInstance(fridge.last_updated, datetime)
+        self.assertEqual([loc.location_id for loc in wh.locations_for("Durable")], ["Shelf-A"])
+        engine = backend.OptimizationEngine(self.data["inventory"], wh)
+        vase = self.data["inventory"].get_product("D02")
+        self.assertIs(engine.find_best_location(vase), wh.find_location_by_id("Shelf-A"))
+        self.assertEqual(engine.find_best_locations([vase]), [wh.find_location_by_id("Shelf-A")])
+
+    def test_orders_and_logger(self):
+        delivered, pending, cancelled = self.data["orders"]
+        self.assertEqual([o.status for o in self.data["orders"]], ["Delivered", "Pending", "Cancelled"])
+        self.assertEqual(pending.get_summary()["items_count"], 2)
+        self.assertIsInstance(pending.get_summary()["created"], datetime)
+        self.assertIs(delivered.items[0], self.data["inventory"].get_product("P01"))
+        pending.start_picking(self.data["inventory"])
+
+        logs = pending._logger.get_logs()
+        self.assertEqual(len(logs), 13) # 12 saved records + the pick above
+        self.assertEqual(logs[0]["message"], "Order ORD-100 changed status to Pending")
+        self.assertEqual(logs[-1]["message"], "Order ORD-101 changed status to Picked")
+        self.assertEqual(len(pending._logger.get_logs(backend.LogKind.WARNING)), 2)
+        times = [r["time"] for r in logs]
+        self.assertEqual(times, sorted(times))
+
+    def test_shipment(self):
+        shipment = self.data["shipments"][0]
+        self.assertTrue(shipment.is_delivered())
+        history = shipment.history()
+        self.assertEqual([text for _, text in history][0], "Shipment created")
+        self.assertEqual(len(history), 3)
+        shipment.flush_events() # Everything was already logged by the old code
+        self.assertEqual(len(shipment._logger.get_logs(backend.LogKind.SHIPMENT_EVENT)), 3)
+
+    def test_resave_round_trip(self):
+        copy = pickle.loads(pickle.dumps(self.data, protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(copy["inventory"].get_total_inventory_value(), 194.5)
+        self.assertEqual([o.status for o in copy["orders"]], ["Delivered", "Pending", "Cancelled"])
+        self.assertEqual(copy["shipments"][0].history(), self.data["shipments"][0].history())
+        self.assertEqual(copy["orders"][0]._logger.export_as_text(),
+                         self.data["orders"][0]._logger.export_as_text())
+
+    def test_gui_reads_baseline_file(self):
+        try:
+            import gui
+        except ImportError: # No tkinter in this Python
+            self.skipTest("tkinter is not available")
+        data = gui.MainApp._read_data_file(SimpleNamespace(data_file=BASELINE_SAVE))
+        self.assertEqual(sorted(data), ["inventory", "orders", "shipments", "warehouse"])
+
+
+if __name__ == "__main__":
+    unittest.main()